@@ -31,7 +31,16 @@ app.register_blueprint(main_bp)
 # Import models for Flask-Login
 from app.models.user import User
 from app.models.preference import Preference
+from app.models.preference_source import PreferenceSource
+from app.models.summary_cache import CachedSummary
+from app.models.search_cache import CachedSearchResult
+from app.models.digest import Digest
+from app.models.article import Article
+from app.models.fetched_window import FetchedWindow
+from app.models.provider_quota import ProviderQuota
+
+from app.utils.user_cache import load_cached_user
 
 @login_manager.user_loader
 def load_user(user_id):
-    return User.query.get(int(user_id))
\ No newline at end of file
+    return load_cached_user(int(user_id))
\ No newline at end of file
@@ -1,7 +1,13 @@
-from flask import Blueprint, render_template, redirect, url_for, flash, request, jsonify
+from flask import Blueprint, render_template, stream_template, redirect, url_for, flash, request, jsonify, Response, current_app
 from flask_login import login_required, current_user
 from app.models.preference import Preference
-from app.utils.perplexity_api import get_article_summaries
+from app.utils.digest_builder import get_current_digest, build_digest, stream_digest
+from app.utils.summary_cache import summary_cache
+from app.utils.search_cache import search_cache, search_flight
+from app.utils.perplexity_api import summary_flight
+from app.utils.quota import get_quota_stats
+from app.utils.provider_health import get_provider_health
+from app.utils.login_tracker import login_tracker
 from app import db
 from datetime import datetime
 
@@ -21,15 +27,34 @@ def home():
     """Handle home page with article summaries"""
     
     # Get user's most recent preference
-    preference = Preference.query.filter_by(user_id=current_user.id).order_by(Preference.updated_at.desc()).first()
+    preference = Preference.get_current_for(current_user)
     
     # If no preferences exist, redirect to input page
     if not preference:
         flash('Please set your article preferences first.', 'info')
         return redirect(url_for('main.input'))
     
-    # Get article summaries based on user preferences
-    summaries = get_article_summaries(preference)
+    # Read the digest precomputed by the background worker
+    digest = get_current_digest(preference)
+    if digest:
+        summaries = digest.get_content()
+    elif current_app.config.get('HOME_STREAMING', True):
+        # No up-to-date digest yet: send the page shell and citations now,
+        # then push each summary to the browser as it completes
+        citations, article_count, summary_stream = stream_digest(preference)
+        response = Response(stream_template(
+            'main/home.html',
+            preference=preference.to_dict(),
+            summaries={'summaries': [], 'citations': citations},
+            pending_count=article_count,
+            summary_stream=summary_stream
+        ), mimetype='text/html')
+        # Stop reverse proxies from buffering the stream
+        response.headers['X-Accel-Buffering'] = 'no'
+        return response
+    else:
+        # No up-to-date digest yet (new preference or worker not running), build it now
+        summaries = build_digest(preference)
     
     return render_template('main/home.html', preference=preference.to_dict(), summaries=summaries)
 
@@ -39,7 +64,7 @@ def input():
     """Handle input page for setting preferences"""
     
     # Get user's existing preference if any
-    existing_preference = Preference.query.filter_by(user_id=current_user.id).order_by(Preference.updated_at.desc()).first()
+    existing_preference = Preference.get_current_for(current_user)
     
     # Process form submission
     if request.method == 'POST':
@@ -134,4 +159,20 @@ def update_timeframe():
     except ValueError:
         flash('Invalid date format', 'error')
     
-    return redirect(url_for('main.home'))
\ No newline at end of file
+    return redirect(url_for('main.home'))
+
+@main_bp.route('/metrics')
+@login_required
+def metrics():
+    """Expose cache counters, provider circuits and buffered login writes of this worker process, and the shared provider quotas"""
+    return jsonify({
+        'summary_cache': summary_cache.get_stats(),
+        'search_cache': search_cache.get_stats(),
+        'single_flight': {
+            'search': search_flight.get_stats(),
+            'summary': summary_flight.get_stats()
+        },
+        'provider_quotas': get_quota_stats(),
+        'providers': get_provider_health(),
+        'last_login_writes': login_tracker.get_stats()
+    })
\ No newline at end of file
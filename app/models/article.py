@@ -0,0 +1,41 @@
+from app import db
+from datetime import datetime
+
+class Article(db.Model):
+    """Article fetched from a search provider, kept for repeat and overlapping queries"""
+
+    __tablename__ = 'articles'
+
+    id = db.Column(db.Integer, primary_key=True)
+    url_hash = db.Column(db.String(64), unique=True, nullable=False)  # SHA-256 of the canonical URL
+    url = db.Column(db.String(2048), nullable=False)
+    canonical_url = db.Column(db.String(2048), nullable=False)
+    source = db.Column(db.String(255), nullable=False)  # Domain the article was searched under
+    source_name = db.Column(db.String(100), nullable=False)
+    published_date = db.Column(db.Date, nullable=False)
+    title = db.Column(db.String(500), nullable=False)
+    snippet = db.Column(db.Text, nullable=True)
+    content = db.Column(db.Text(16777215), nullable=True)
+    fetched_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        db.Index('idx_source_published', 'source', 'published_date'),
+        db.Index('ft_article_text', 'title', 'snippet', 'content', mysql_prefix='FULLTEXT'),
+    )
+
+    def to_search_result(self):
+        """Convert the article to the dictionary shape returned by the search providers"""
+        return {
+            'title': self.title,
+            'url': self.url,
+            'canonical_url': self.canonical_url,
+            'source': self.source_name,
+            'date': self.published_date.strftime('%Y-%m-%d'),
+            'display_date': self.published_date.strftime('%B %d, %Y'),
+            'snippet': self.snippet or '',
+            'content': self.content or ''
+        }
+
+    def __repr__(self):
+        """Representation of the Article model"""
+        return f'<Article {self.id}: {self.title[:40]}>'
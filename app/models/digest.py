@@ -0,0 +1,40 @@
+from app import db
+from datetime import datetime
+import json
+
+class Digest(db.Model):
+    """Materialized article summaries for a preference"""
+
+    __tablename__ = 'digests'
+
+    id = db.Column(db.Integer, primary_key=True)
+    preference_id = db.Column(db.Integer, db.ForeignKey('preferences.id', ondelete='CASCADE'), nullable=False)
+    preference_version = db.Column(db.DateTime, nullable=False)  # Preference.updated_at the digest was built from
+    content = db.Column(db.Text(16777215), nullable=False)  # Stored as JSON string
+    built_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        db.Index('idx_preference_built', 'preference_id', 'built_at'),
+    )
+
+    def __init__(self, preference_id, preference_version, summaries):
+        """Initialize a new digest"""
+        self.preference_id = preference_id
+        self.preference_version = preference_version
+        self.set_content(summaries)
+
+    def set_content(self, summaries):
+        """Convert the summaries dictionary to JSON string for storage"""
+        self.content = json.dumps(summaries)
+
+    def get_content(self):
+        """Get the summaries as a Python dictionary"""
+        return json.loads(self.content)
+
+    def is_current_for(self, preference):
+        """Check whether the digest was built from the preference's latest settings"""
+        return preference.updated_at is None or self.preference_version >= preference.updated_at
+
+    def __repr__(self):
+        """Representation of the Digest model"""
+        return f'<Digest {self.id}: preference {self.preference_id}>'
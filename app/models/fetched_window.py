@@ -0,0 +1,21 @@
+from app import db
+from datetime import datetime
+
+class FetchedWindow(db.Model):
+    """A day already fetched from the providers for a search query and source"""
+
+    __tablename__ = 'fetched_windows'
+
+    id = db.Column(db.Integer, primary_key=True)
+    query_hash = db.Column(db.String(64), nullable=False)  # SHA-256 of the normalized search query
+    source = db.Column(db.String(255), nullable=False)
+    day = db.Column(db.Date, nullable=False)
+    fetched_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        db.UniqueConstraint('query_hash', 'source', 'day', name='uq_query_source_day'),
+    )
+
+    def __repr__(self):
+        """Representation of the FetchedWindow model"""
+        return f'<FetchedWindow {self.source} {self.day}>'
@@ -1,5 +1,8 @@
 from app import db
 from datetime import datetime
+from sqlalchemy import event
+from app.models.preference_source import PreferenceSource
+from app.utils.sources import normalize_source, normalize_sources
 import json
 
 class Preference(db.Model):
@@ -16,6 +19,18 @@ class Preference(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
+    # Relationship with Digests
+    digests = db.relationship('Digest', backref='preference', lazy='dynamic', cascade="all, delete-orphan")
+    
+    # Normalized domains of the sources, written together with the JSON column
+    source_domains = db.relationship('PreferenceSource', backref='preference', order_by='PreferenceSource.position',
+                                     cascade="all, delete-orphan", passive_deletes=True)
+    
+    __table_args__ = (
+        # Serves "latest preference of a user" without a sort
+        db.Index('idx_user_updated', 'user_id', 'updated_at'),
+    )
+    
     def __init__(self, user_id, area_of_interest, start_date, end_date, sources):
         """Initialize a new preference"""
         self.user_id = user_id
@@ -25,16 +40,71 @@ class Preference(db.Model):
         self.set_sources(sources)
     
     def set_sources(self, sources):
-        """Convert sources list to JSON string for storage"""
-        if isinstance(sources, list):
-            self.sources = json.dumps(sources)
-        else:
-            # If it's a single string, convert to list then JSON
-            self.sources = json.dumps([sources])
+        """Convert sources list to JSON string for storage and store their normalized domains"""
+        if not isinstance(sources, list):
+            # If it's a single string, convert to list
+            sources = [sources]
+        self.sources = json.dumps(sources)
+        
+        # Keep the rows of domains still listed, so re-saving a source does
+        # not insert a duplicate before the old row is deleted
+        existing = {row.domain: row for row in self.source_domains}
+        rows = []
+        for position, domain in enumerate(normalize_sources(sources)):
+            row = existing.get(domain) or PreferenceSource(domain)
+            row.position = position
+            rows.append(row)
+        self.source_domains = rows
+    
+    def _parsed_sources(self):
+        """Parse the JSON column once per value; returns (sources, domains)"""
+        cached = self.__dict__.get('_sources_cache')
+        if cached is None or cached[0] is not self.sources:
+            sources = json.loads(self.sources)
+            cached = (self.sources, sources, normalize_sources(sources))
+            self.__dict__['_sources_cache'] = cached
+        return cached[1], cached[2]
     
     def get_sources(self):
-        """Get sources as a Python list"""
-        return json.loads(self.sources)
+        """Get sources as a Python list, as the user entered them"""
+        return list(self._parsed_sources()[0])
+    
+    def get_domains(self):
+        """Get the normalized domains of the sources, without duplicates"""
+        return list(self._parsed_sources()[1])
+    
+    @classmethod
+    def with_source(cls, source):
+        """
+        Query the preferences that include a source, using the domain index.
+        
+        Args:
+            source: Source name or domain, e.g. "Reuters" or "reuters.com"
+        
+        Returns:
+            Query: Preferences including the source
+        """
+        return cls.query.join(PreferenceSource).filter(PreferenceSource.domain == normalize_source(source))
+    
+    @classmethod
+    def get_current_for(cls, user):
+        """
+        Get a user's current (most recently updated) preference.
+        
+        Args:
+            user: The user, or the cached record used as current_user
+        
+        Returns:
+            Preference: The preference, or None if the user has none
+        """
+        preference_id = getattr(user, 'current_preference_id', None)
+        if preference_id:
+            preference = cls.query.get(preference_id)
+            if preference and preference.user_id == user.id:
+                return preference
+        
+        # Pointer not set yet (e.g. rows from before the migration)
+        return cls.query.filter_by(user_id=user.id).order_by(cls.updated_at.desc()).first()
     
     def to_dict(self):
         """Convert preference to dictionary for easier access in templates"""
@@ -51,4 +121,13 @@ class Preference(db.Model):
     
     def __repr__(self):
         """Representation of the Preference model"""
-        return f'<Preference {self.id}: {self.area_of_interest}>'
\ No newline at end of file
+        return f'<Preference {self.id}: {self.area_of_interest}>'
+
+@event.listens_for(Preference, 'after_insert')
+@event.listens_for(Preference, 'after_update')
+def _set_current_preference(mapper, connection, target):
+    """Point the user at the preference written last, in the same transaction"""
+    connection.execute(
+        db.text("UPDATE users SET current_preference_id = :preference_id WHERE id = :user_id"),
+        {'preference_id': target.id, 'user_id': target.user_id}
+    )
@@ -0,0 +1,26 @@
+from app import db
+
+class PreferenceSource(db.Model):
+    """Normalized domain of a preference source, indexed for lookups across preferences"""
+
+    __tablename__ = 'preference_sources'
+
+    id = db.Column(db.Integer, primary_key=True)
+    preference_id = db.Column(db.Integer, db.ForeignKey('preferences.id', ondelete='CASCADE'), nullable=False)
+    domain = db.Column(db.String(255), nullable=False)
+    position = db.Column(db.Integer, nullable=False, default=0)  # Order the user listed the source in
+
+    __table_args__ = (
+        db.UniqueConstraint('preference_id', 'domain', name='uq_preference_domain'),
+        # Serves "all preferences that include a domain"
+        db.Index('idx_domain', 'domain'),
+    )
+
+    def __init__(self, domain, position=0):
+        """Initialize a new preference source"""
+        self.domain = domain
+        self.position = position
+
+    def __repr__(self):
+        """Representation of the PreferenceSource model"""
+        return f'<PreferenceSource {self.preference_id}: {self.domain}>'
@@ -0,0 +1,17 @@
+from app import db
+
+class ProviderQuota(db.Model):
+    """Shared rate limit state of an external provider, used by every worker process"""
+
+    __tablename__ = 'provider_quotas'
+
+    provider = db.Column(db.String(50), primary_key=True)
+    tokens = db.Column(db.Float, nullable=False)  # Requests left in the token bucket
+    refilled_at = db.Column(db.Float, nullable=False)  # Unix time the bucket was last refilled
+    day = db.Column(db.Date, nullable=False)  # UTC day day_count belongs to
+    day_count = db.Column(db.Integer, nullable=False, default=0)
+    blocked_until = db.Column(db.Float, nullable=False, default=0)  # Unix time; set when the provider reports a rate limit
+
+    def __repr__(self):
+        """Representation of the ProviderQuota model"""
+        return f'<ProviderQuota {self.provider}: {self.tokens:.1f} tokens, {self.day_count} today>'
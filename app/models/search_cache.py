@@ -0,0 +1,34 @@
+from app import db
+from datetime import datetime
+import json
+
+class CachedSearchResult(db.Model):
+    """Cached provider search results keyed by a hash of the provider request"""
+
+    __tablename__ = 'search_cache'
+
+    id = db.Column(db.Integer, primary_key=True)
+    cache_key = db.Column(db.String(64), unique=True, nullable=False, index=True)  # SHA-256 hex digest
+    provider = db.Column(db.String(20), nullable=False)
+    results = db.Column(db.Text(16777215), nullable=False)  # Stored as JSON string
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    expires_at = db.Column(db.DateTime, nullable=False, index=True)
+
+    def __init__(self, cache_key, provider, results, expires_at):
+        """Initialize a new cached search result"""
+        self.cache_key = cache_key
+        self.provider = provider
+        self.expires_at = expires_at
+        self.set_results(results)
+
+    def set_results(self, results):
+        """Convert the list of articles to JSON string for storage"""
+        self.results = json.dumps(results)
+
+    def get_results(self):
+        """Get the cached articles as a Python list"""
+        return json.loads(self.results)
+
+    def __repr__(self):
+        """Representation of the CachedSearchResult model"""
+        return f'<CachedSearchResult {self.provider} {self.cache_key[:12]}>'
@@ -0,0 +1,23 @@
+from app import db
+from datetime import datetime
+
+class CachedSummary(db.Model):
+    """Cached article summary keyed by a hash of the summarization request"""
+
+    __tablename__ = 'summary_cache'
+
+    id = db.Column(db.Integer, primary_key=True)
+    cache_key = db.Column(db.String(64), unique=True, nullable=False, index=True)  # SHA-256 hex digest
+    model = db.Column(db.String(50), nullable=False)
+    summary = db.Column(db.Text, nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False, index=True)
+
+    def __init__(self, cache_key, model, summary):
+        """Initialize a new cached summary"""
+        self.cache_key = cache_key
+        self.model = model
+        self.summary = summary
+
+    def __repr__(self):
+        """Representation of the CachedSummary model"""
+        return f'<CachedSummary {self.cache_key[:12]}>'
@@ -15,8 +15,18 @@ class User(db.Model, UserMixin):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     last_login = db.Column(db.DateTime, nullable=True)
     
+    # Most recently written preference, kept up to date by Preference events
+    current_preference_id = db.Column(
+        db.Integer,
+        db.ForeignKey('preferences.id', use_alter=True, name='fk_users_current_preference', ondelete='SET NULL'),
+        nullable=True
+    )
+    
     # Relationship with Preferences
-    preferences = db.relationship('Preference', backref='user', lazy='dynamic', cascade="all, delete-orphan")
+    preferences = db.relationship(
+        'Preference', backref='user', lazy='dynamic', cascade="all, delete-orphan",
+        foreign_keys='Preference.user_id'
+    )
     
     def __init__(self, username, email, password):
         """Initialize a new user"""
@@ -33,8 +43,14 @@ class User(db.Model, UserMixin):
         return check_password_hash(self.password_hash, password)
     
     def update_last_login(self):
-        """Update the last login time to current time"""
-        self.last_login = datetime.utcnow()
+        """Update the last login time to current time, written behind the request by default"""
+        # Imported here: the tracker depends on the user cache, which imports this model
+        from app.utils.login_tracker import record_login
+        
+        now = datetime.utcnow()
+        if record_login(self.id, now):
+            return
+        self.last_login = now
         db.session.commit()
     
     def __repr__(self):
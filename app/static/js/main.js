@@ -119,4 +119,53 @@ function createElement(tag, attributes = {}, content = '') {
     }
     
     return element;
-}
\ No newline at end of file
+}
+
+/**
+ * Replace a summary placeholder on the home page with its summary card
+ * @param {object} summary - Summary with index, title, source, summary_text and article_url
+ */
+function insertSummaryCard(summary) {
+    const slot = document.querySelector(`[data-summary-slot="${summary.index}"]`);
+    if (!slot) return;
+    
+    const card = createElement('div', { class: 'bg-gray-50 p-6 rounded-lg' });
+    
+    // Title and source
+    const header = createElement('div', { class: 'flex flex-col md:flex-row justify-between items-start md:items-center mb-4' });
+    const heading = createElement('h3', { class: 'text-xl font-semibold text-gray-900' });
+    if (summary.article_url) {
+        heading.appendChild(createElement('a', {
+            href: summary.article_url,
+            target: '_blank',
+            rel: 'noopener noreferrer',
+            class: 'hover:text-blue-600 hover:underline'
+        }, summary.title));
+    } else {
+        heading.textContent = summary.title;
+    }
+    header.appendChild(heading);
+    header.appendChild(createElement('span', { class: 'text-sm text-gray-600 mt-1 md:mt-0' }, `From: ${summary.source}`));
+    card.appendChild(header);
+    
+    // Bullet points
+    const list = createElement('ul', { class: 'list-disc pl-5 space-y-2' });
+    (summary.summary_text || []).forEach(point => {
+        list.appendChild(createElement('li', { class: 'text-gray-700' }, point));
+    });
+    card.appendChild(list);
+    
+    // Link to the full article
+    if (summary.article_url) {
+        const footer = createElement('div', { class: 'mt-4 text-right' });
+        footer.appendChild(createElement('a', {
+            href: summary.article_url,
+            target: '_blank',
+            rel: 'noopener noreferrer',
+            class: 'text-sm text-blue-600 hover:text-blue-500 hover:underline inline-flex items-center'
+        }, 'Read full article'));
+        card.appendChild(footer);
+    }
+    
+    slot.replaceWith(card);
+}
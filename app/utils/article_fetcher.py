@@ -0,0 +1,181 @@
+import importlib.util
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from urllib.parse import urlsplit
+import requests
+from bs4 import BeautifulSoup
+from flask import current_app
+from app.utils.article_store import canonicalize_url
+from app.utils.http_client import get_session, get_timeout
+from app.utils.search_cache import TTLCache
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# lxml parses several times faster than the bundled parser when it is installed
+HTML_PARSER = 'lxml' if importlib.util.find_spec('lxml') else 'html.parser'
+
+# Browser-like headers; many publishers reject the default requests user agent
+FETCH_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml'
+}
+
+# Tags that never hold the article body
+BOILERPLATE_TAGS = ['script', 'style', 'noscript', 'nav', 'header', 'footer', 'aside', 'form', 'figure']
+
+# Paragraphs shorter than this are usually captions, bylines or buttons
+MIN_PARAGRAPH_LENGTH = 40
+
+CHUNK_SIZE = 16384
+
+# Extracted article bodies keyed by canonical URL; failed pages are cached as ''
+_body_cache = TTLCache(max_entries=2000)
+
+def extract_text(html, encoding=None):
+    """
+    Extract the main text of an article page.
+
+    Args:
+        html: Page HTML, as text or raw bytes
+        encoding: Charset of raw bytes; if None it is read from the page's <meta> tag
+
+    Returns:
+        str: Article paragraphs separated by newlines, or '' if none were found
+    """
+    soup = BeautifulSoup(html, HTML_PARSER, from_encoding=encoding) if isinstance(html, bytes) else BeautifulSoup(html, HTML_PARSER)
+    for tag in soup(BOILERPLATE_TAGS):
+        tag.decompose()
+
+    container = soup.find('article') or soup.find('main') or soup.body or soup
+    paragraphs = (p.get_text(' ', strip=True) for p in container.find_all('p'))
+    text = '\n'.join(p for p in paragraphs if len(p) >= MIN_PARAGRAPH_LENGTH)
+
+    soup.decompose()
+    return text
+
+def _download(session, url, timeout, max_bytes, deadline_at, semaphore):
+    """
+    Stream a page, stopping at max_bytes or the deadline.
+
+    Returns:
+        str: Extracted article text, or '' if the page could not be used
+    """
+    with semaphore:
+        if time.monotonic() >= deadline_at:
+            return None
+
+        with session.get(url, headers=FETCH_HEADERS, timeout=timeout, stream=True) as response:
+            if response.status_code != 200 or 'html' not in response.headers.get('Content-Type', ''):
+                return ''
+
+            body = bytearray()
+            for chunk in response.iter_content(CHUNK_SIZE):
+                body.extend(chunk)
+                if len(body) >= max_bytes:
+                    break
+                if time.monotonic() >= deadline_at:
+                    return None
+
+            # requests assumes ISO-8859-1 for HTML without a charset header, so only
+            # trust an explicit one and otherwise let the parser read <meta charset>
+            content_type = response.headers.get('Content-Type', '').lower()
+            encoding = response.encoding if 'charset=' in content_type else None
+            html = bytes(body[:max_bytes])
+
+    return extract_text(html, encoding)
+
+def _apply_body(article, text):
+    """Use the fetched body as the article content if it says more than the snippet"""
+    if text and len(text) > len(article.get('content', '')):
+        article['content'] = f"{article.get('title', '')}. {text}"
+
+def fetch_article_bodies(articles):
+    """
+    Replace snippet content with the full text of each article's page.
+
+    Pages are downloaded concurrently with at most ARTICLE_FETCH_PER_HOST
+    connections per publisher. Downloads still running when
+    ARTICLE_FETCH_DEADLINE passes are abandoned and their articles keep
+    the snippet.
+
+    Args:
+        articles: List of article dictionaries, updated in place
+
+    Returns:
+        list: The same articles
+    """
+    config = current_app.config
+    if not config.get('ARTICLE_FETCH_ENABLED', True) or not articles:
+        return articles
+
+    cache_ttl = config.get('ARTICLE_FETCH_CACHE_TTL', 6 * 3600)
+
+    pending = []
+    for article in articles:
+        url = article.get('url', '')
+        # Mock and fallback articles have made-up URLs on real publisher domains
+        if article.get('is_mock') or not url.startswith(('http://', 'https://')):
+            continue
+
+        key = canonicalize_url(url)
+        cached = _body_cache.get(key)
+        if cached is not None:
+            _apply_body(article, cached)
+        else:
+            pending.append((article, key))
+
+    if not pending:
+        return articles
+
+    deadline = config.get('ARTICLE_FETCH_DEADLINE', 8)
+    deadline_at = time.monotonic() + deadline
+    max_bytes = config.get('ARTICLE_FETCH_MAX_BYTES', 1024 * 1024)
+    per_host = config.get('ARTICLE_FETCH_PER_HOST', 2)
+    session = get_session()
+    timeout = get_timeout('default')
+
+    semaphores = {}
+    for article, _ in pending:
+        host = urlsplit(article['url']).netloc.lower()
+        semaphores.setdefault(host, threading.Semaphore(per_host))
+
+    executor = ThreadPoolExecutor(max_workers=min(config.get('ARTICLE_FETCH_MAX_WORKERS', 8), len(pending)))
+    futures = {
+        executor.submit(
+            _download, session, article['url'], timeout, max_bytes, deadline_at,
+            semaphores[urlsplit(article['url']).netloc.lower()]
+        ): (article, key)
+        for article, key in pending
+    }
+
+    done, not_done = wait(futures, timeout=deadline)
+
+    # Don't wait for slow publishers; their downloads stop at the deadline on their own
+    executor.shutdown(wait=False, cancel_futures=True)
+
+    for future in done:
+        article, key = futures[future]
+        try:
+            text = future.result()
+        except requests.exceptions.RequestException as e:
+            logger.info(f"Could not fetch {article['url']}: {str(e)}")
+            text = ''
+        except Exception as e:
+            logger.warning(f"Error extracting {article['url']}: {str(e)}")
+            text = ''
+
+        # None means the deadline cut the download short; try again next time
+        if text is None:
+            continue
+
+        _body_cache.set(key, text, cache_ttl)
+        _apply_body(article, text)
+
+    if not_done:
+        logger.info(f"{len(not_done)} of {len(pending)} article pages missed the {deadline}s deadline; using snippets")
+
+    return articles
@@ -0,0 +1,247 @@
+import hashlib
+import logging
+import re
+from datetime import datetime, timedelta
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from flask import current_app
+from sqlalchemy.dialects.mysql import insert
+from app import db
+from app.models.article import Article
+from app.models.fetched_window import FetchedWindow
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Query parameters that only track the visitor and never change the page
+TRACKING_PARAMS = {'fbclid', 'gclid', 'ocid', 'cmpid', 'mc_cid', 'mc_eid', 'ref', 'smid', 'taid'}
+
+def canonicalize_url(url):
+    """
+    Normalize a URL so the same article always gets the same key.
+
+    Lowercases the scheme and host, drops 'www.', the fragment, tracking
+    parameters and a trailing slash.
+
+    Args:
+        url: Article URL
+
+    Returns:
+        str: Canonical URL
+    """
+    try:
+        parts = urlsplit(url.strip())
+    except ValueError:
+        return url
+
+    host = parts.netloc.lower()
+    if host.startswith('www.'):
+        host = host[4:]
+
+    query = urlencode(sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith('utm_') and key.lower() not in TRACKING_PARAMS
+    ))
+    path = parts.path.rstrip('/') or '/'
+
+    return urlunsplit(((parts.scheme or 'https').lower(), host, path, query, ''))
+
+def _url_hash(canonical_url):
+    return hashlib.sha256(canonical_url.encode('utf-8')).hexdigest()
+
+def _enabled():
+    return current_app.config.get('ARTICLE_STORE_ENABLED', True)
+
+def store_articles(articles, source_domain):
+    """
+    Bulk insert provider results into the article store, skipping known URLs.
+
+    Articles whose date the provider did not supply are left out: their
+    placeholder dates would place them in the date windows of later searches.
+
+    Args:
+        articles: List of article dictionaries from a provider
+        source_domain: Domain the articles were searched under
+    """
+    if not _enabled() or not articles:
+        return
+
+    rows = []
+    for article in articles:
+        if not article.get('url') or article.get('date_is_estimated') or article.get('is_mock'):
+            continue
+        try:
+            published_date = datetime.strptime(article.get('date', ''), '%Y-%m-%d').date()
+        except ValueError:
+            continue
+
+        canonical_url = article.get('canonical_url') or canonicalize_url(article['url'])
+        rows.append({
+            'url_hash': _url_hash(canonical_url),
+            'url': article['url'][:2048],
+            'canonical_url': canonical_url[:2048],
+            'source': source_domain,
+            'source_name': (article.get('source') or '')[:100],
+            'published_date': published_date,
+            'title': (article.get('title') or '')[:500],
+            'snippet': article.get('snippet', ''),
+            'content': article.get('content', ''),
+            'fetched_at': datetime.utcnow()
+        })
+
+    if not rows:
+        return
+
+    try:
+        # One multi-row INSERT; rows whose URL is already stored are ignored
+        db.session.execute(Article.__table__.insert().prefix_with('IGNORE'), rows)
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        logger.warning(f"Error storing articles: {str(e)}")
+
+def find_stored_articles(query, source_domain, start_date, end_date, limit):
+    """
+    Find stored articles for a source and date window matching a search query.
+
+    Args:
+        query: Search query, matched against the full-text index
+        source_domain: Domain the articles were searched under
+        start_date: Start date (YYYY-MM-DD)
+        end_date: End date (YYYY-MM-DD)
+        limit: Maximum number of articles to return
+
+    Returns:
+        list: Article dictionaries, best full-text match first
+    """
+    if not _enabled():
+        return []
+
+    # Natural language mode takes plain words; drop quotes and operators
+    terms = re.sub(r'[^\w\s]', ' ', query).strip()
+    if not terms:
+        return []
+
+    match = db.text("MATCH (title, snippet, content) AGAINST (:terms IN NATURAL LANGUAGE MODE)").bindparams(terms=terms)
+
+    try:
+        stored = (
+            Article.query
+            .filter(
+                Article.source == source_domain,
+                Article.published_date.between(start_date, end_date),
+                match
+            )
+            .order_by(db.desc(match))
+            .limit(limit)
+            .all()
+        )
+    except Exception as e:
+        db.session.rollback()
+        logger.warning(f"Error reading stored articles: {str(e)}")
+        return []
+
+    return [article.to_search_result() for article in stored]
+
+def _query_hash(query):
+    normalized = ' '.join(query.lower().split())
+    return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+
+def _days_between(start_date, end_date):
+    start = datetime.strptime(start_date, '%Y-%m-%d').date()
+    end = datetime.strptime(end_date, '%Y-%m-%d').date()
+    return [start + timedelta(days=offset) for offset in range((end - start).days + 1)]
+
+def get_uncovered_ranges(query, source_domain, start_date, end_date):
+    """
+    Find the parts of a date window that have not been fetched for a query and source yet.
+
+    Days from yesterday onwards are never treated as covered, since
+    publishers are still adding articles for them. Neither are days fetched
+    longer than FETCHED_WINDOW_TTL ago.
+
+    Args:
+        query: Search query
+        source_domain: Domain the articles are searched under
+        start_date: Start date (YYYY-MM-DD)
+        end_date: End date (YYYY-MM-DD)
+
+    Returns:
+        list: (start_date, end_date) string tuples of contiguous uncovered days
+    """
+    days = _days_between(start_date, end_date)
+    if not _enabled():
+        return [(start_date, end_date)] if days else []
+
+    fetched_after = datetime.utcnow() - timedelta(seconds=current_app.config.get('FETCHED_WINDOW_TTL', 7 * 24 * 3600))
+
+    covered = set()
+    try:
+        covered = {
+            row.day for row in
+            FetchedWindow.query
+            .with_entities(FetchedWindow.day)
+            .filter(
+                FetchedWindow.query_hash == _query_hash(query),
+                FetchedWindow.source == source_domain,
+                FetchedWindow.day.between(days[0], days[-1]),
+                FetchedWindow.fetched_at >= fetched_after
+            )
+        } if days else set()
+    except Exception as e:
+        db.session.rollback()
+        logger.warning(f"Error reading fetched windows: {str(e)}")
+
+    recent = datetime.utcnow().date() - timedelta(days=1)
+
+    ranges = []
+    range_start = None
+    previous = None
+    for day in days:
+        if day in covered and day < recent:
+            if range_start is not None:
+                ranges.append((range_start, previous))
+                range_start = None
+        elif range_start is None:
+            range_start = day
+        previous = day
+
+    if range_start is not None:
+        ranges.append((range_start, previous))
+
+    return [(start.strftime('%Y-%m-%d'), end.strftime('%Y-%m-%d')) for start, end in ranges]
+
+def mark_range_fetched(query, source_domain, start_date, end_date):
+    """
+    Record that a date window has been fetched from the providers.
+
+    Call only when a provider answered for the whole window: days without
+    articles then count as quiet, not unknown.
+
+    Args:
+        query: Search query
+        source_domain: Domain the articles were searched under
+        start_date: Start date (YYYY-MM-DD)
+        end_date: End date (YYYY-MM-DD)
+    """
+    if not _enabled():
+        return
+
+    query_hash = _query_hash(query)
+    now = datetime.utcnow()
+    rows = [
+        {'query_hash': query_hash, 'source': source_domain, 'day': day, 'fetched_at': now}
+        for day in _days_between(start_date, end_date)
+    ]
+
+    if not rows:
+        return
+
+    try:
+        # Refresh fetched_at of days recorded before, so expired days count again
+        statement = insert(FetchedWindow.__table__).values(rows)
+        db.session.execute(statement.on_duplicate_key_update(fetched_at=statement.inserted.fetched_at))
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        logger.warning(f"Error recording fetched windows: {str(e)}")
@@ -0,0 +1,65 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from flask import current_app
+
+def _with_app_context(app, func):
+    """Wrap func so it runs inside an application context of app"""
+    def wrapper(*args, **kwargs):
+        with app.app_context():
+            return func(*args, **kwargs)
+    return wrapper
+
+def run_concurrently(func, items, max_workers):
+    """
+    Call func on every item using a bounded thread pool.
+
+    Each call runs inside its own application context so that code relying on
+    current_app (configuration, database session) keeps working in the workers.
+
+    Args:
+        func: Callable taking a single item
+        items: Items to process
+        max_workers: Maximum number of calls in flight at once
+
+    Returns:
+        list: Results in the same order as items
+    """
+    items = list(items)
+    if not items:
+        return []
+
+    # Run inline when there is nothing to parallelise
+    if max_workers <= 1 or len(items) == 1:
+        return [func(item) for item in items]
+
+    task = _with_app_context(current_app._get_current_object(), func)
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(task, items))
+
+def iter_concurrently(func, items, max_workers):
+    """
+    Call func on every item using a bounded thread pool, yielding results as they finish.
+
+    Args:
+        func: Callable taking a single item
+        items: Items to process
+        max_workers: Maximum number of calls in flight at once
+
+    Yields:
+        tuple: (index of the item, result) in completion order
+    """
+    items = list(items)
+    if not items:
+        return
+
+    if max_workers <= 1 or len(items) == 1:
+        for index, item in enumerate(items):
+            yield index, func(item)
+        return
+
+    task = _with_app_context(current_app._get_current_object(), func)
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        futures = {executor.submit(task, item): index for index, item in enumerate(items)}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
@@ -1,6 +1,7 @@
 from app import db
+from app.utils.sources import normalize_sources
 import pymysql
-from flask import current_app
+import json
 import os
 
 def init_db():
@@ -14,37 +15,26 @@ def init_db():
     try:
         # Create all tables defined in models
         db.create_all()
-        return True
+        
+        # Bring tables created by older versions up to date
+        return migrate_schema()
     except Exception as e:
         print(f"Error initializing database: {str(e)}")
         return False
 
 def get_db_connection():
     """
-    Get a direct connection to the MySQL database.
+    Borrow a direct connection to the MySQL database from the SQLAlchemy pool.
     Useful for executing complex queries that aren't easily done with SQLAlchemy.
     
+    Closing the connection returns it to the pool. Open cursors with
+    connection.cursor(pymysql.cursors.DictCursor) to get rows as dictionaries.
+    
     Returns:
-        Connection: A pymysql connection object
+        Connection: A pooled pymysql connection proxy
     """
     try:
-        # Get database configuration from environment variables
-        db_username = current_app.config.get('SQLALCHEMY_DATABASE_URI').split(':')[1][2:]
-        db_password = current_app.config.get('SQLALCHEMY_DATABASE_URI').split(':')[2].split('@')[0]
-        db_host = current_app.config.get('SQLALCHEMY_DATABASE_URI').split('@')[1].split('/')[0]
-        db_name = current_app.config.get('SQLALCHEMY_DATABASE_URI').split('/')[-1]
-        
-        # Create connection
-        connection = pymysql.connect(
-            host=db_host,
-            user=db_username,
-            password=db_password,
-            database=db_name,
-            charset='utf8mb4',
-            cursorclass=pymysql.cursors.DictCursor
-        )
-        
-        return connection
+        return db.engine.raw_connection()
     except Exception as e:
         print(f"Error connecting to database: {str(e)}")
         return None
@@ -65,17 +55,147 @@ def execute_query(query, params=None):
     
     if connection:
         try:
-            with connection.cursor() as cursor:
+            with connection.cursor(pymysql.cursors.DictCursor) as cursor:
                 cursor.execute(query, params or ())
                 results = cursor.fetchall()
             connection.commit()
         except Exception as e:
+            connection.rollback()
             print(f"Error executing query: {str(e)}")
         finally:
             connection.close()
     
     return results
 
+def execute_many(query, params_seq):
+    """
+    Execute a SQL statement once per parameter set, in a single transaction.
+    
+    pymysql rewrites INSERT ... VALUES statements into one multi-row INSERT.
+    
+    Args:
+        query (str): SQL statement to execute
+        params_seq (list): Parameter tuples, one per execution
+    
+    Returns:
+        int: Number of affected rows, or 0 on failure
+    """
+    params_seq = list(params_seq)
+    if not params_seq:
+        return 0
+    
+    connection = get_db_connection()
+    affected = 0
+    
+    if connection:
+        try:
+            with connection.cursor() as cursor:
+                affected = cursor.executemany(query, params_seq) or 0
+            connection.commit()
+        except Exception as e:
+            connection.rollback()
+            affected = 0
+            print(f"Error executing query: {str(e)}")
+        finally:
+            connection.close()
+    
+    return affected
+
+def _column_exists(cursor, table, column):
+    cursor.execute(
+        "SELECT 1 FROM information_schema.COLUMNS WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND COLUMN_NAME = %s",
+        (table, column)
+    )
+    return cursor.fetchone() is not None
+
+def _index_exists(cursor, table, index):
+    cursor.execute(
+        "SELECT 1 FROM information_schema.STATISTICS WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND INDEX_NAME = %s",
+        (table, index)
+    )
+    return cursor.fetchone() is not None
+
+def _constraint_exists(cursor, table, constraint):
+    cursor.execute(
+        "SELECT 1 FROM information_schema.TABLE_CONSTRAINTS WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND CONSTRAINT_NAME = %s",
+        (table, constraint)
+    )
+    return cursor.fetchone() is not None
+
+def migrate_schema():
+    """
+    Apply schema changes that db.create_all() does not make to existing tables.
+    Every step checks information_schema first, so this is safe to run on every start.
+    
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    connection = get_db_connection()
+    if not connection:
+        return False
+    
+    try:
+        with connection.cursor() as cursor:
+            # Composite index for the latest preference of a user
+            if not _index_exists(cursor, 'preferences', 'idx_user_updated'):
+                cursor.execute("ALTER TABLE preferences ADD INDEX idx_user_updated (user_id, updated_at)")
+            
+            # Pointer from each user to their current preference
+            if not _column_exists(cursor, 'users', 'current_preference_id'):
+                cursor.execute("ALTER TABLE users ADD COLUMN current_preference_id INT NULL")
+            
+            if not _constraint_exists(cursor, 'users', 'fk_users_current_preference'):
+                cursor.execute("""
+                ALTER TABLE users ADD CONSTRAINT fk_users_current_preference
+                    FOREIGN KEY (current_preference_id) REFERENCES preferences(id) ON DELETE SET NULL
+                """)
+            
+            # Backfill the pointer for users whose preferences predate it
+            cursor.execute("""
+            UPDATE users u
+            SET current_preference_id = (
+                SELECT p.id FROM preferences p
+                WHERE p.user_id = u.id
+                ORDER BY p.updated_at DESC, p.id DESC
+                LIMIT 1
+            )
+            WHERE u.current_preference_id IS NULL
+            """)
+            
+            # Normalized domains for preferences saved before the preference_sources table
+            cursor.execute("""
+            SELECT p.id, p.sources FROM preferences p
+            WHERE NOT EXISTS (SELECT 1 FROM preference_sources ps WHERE ps.preference_id = p.id)
+            """)
+            rows = []
+            for preference_id, sources in cursor.fetchall():
+                try:
+                    sources = json.loads(sources)
+                except ValueError:
+                    continue
+                if not isinstance(sources, list):
+                    sources = [sources]
+                rows.extend(
+                    (preference_id, domain, position)
+                    for position, domain in enumerate(normalize_sources(sources))
+                )
+            if rows:
+                cursor.executemany(
+                    "INSERT INTO preference_sources (preference_id, domain, position) VALUES (%s, %s, %s)",
+                    rows
+                )
+        
+        connection.commit()
+        return True
+    
+    except Exception as e:
+        connection.rollback()
+        print(f"Error migrating database schema: {str(e)}")
+        return False
+    
+    finally:
+        connection.close()
+
 def create_database_schema():
     """
     Create the database schema for the application.
@@ -117,6 +237,7 @@ def create_database_schema():
                 password_hash VARCHAR(128) NOT NULL,
                 created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
                 last_login DATETIME NULL,
+                current_preference_id INT NULL,
                 INDEX idx_username (username),
                 INDEX idx_email (email)
             ) ENGINE=InnoDB;
@@ -134,7 +255,108 @@ def create_database_schema():
                 created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
                 updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
                 FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
-                INDEX idx_user_id (user_id)
+                INDEX idx_user_updated (user_id, updated_at)
+            ) ENGINE=InnoDB;
+            """)
+            
+            # Create preference sources table
+            cursor.execute("""
+            CREATE TABLE IF NOT EXISTS preference_sources (
+                id INT AUTO_INCREMENT PRIMARY KEY,
+                preference_id INT NOT NULL,
+                domain VARCHAR(255) NOT NULL,
+                position INT NOT NULL DEFAULT 0,
+                FOREIGN KEY (preference_id) REFERENCES preferences(id) ON DELETE CASCADE,
+                UNIQUE KEY uq_preference_domain (preference_id, domain),
+                INDEX idx_domain (domain)
+            ) ENGINE=InnoDB;
+            """)
+            
+            # Point users at their current preference; added after both tables exist
+            if not _constraint_exists(cursor, 'users', 'fk_users_current_preference'):
+                cursor.execute("""
+                ALTER TABLE users ADD CONSTRAINT fk_users_current_preference
+                    FOREIGN KEY (current_preference_id) REFERENCES preferences(id) ON DELETE SET NULL;
+                """)
+            
+            # Create summary cache table
+            cursor.execute("""
+            CREATE TABLE IF NOT EXISTS summary_cache (
+                id INT AUTO_INCREMENT PRIMARY KEY,
+                cache_key VARCHAR(64) NOT NULL UNIQUE,
+                model VARCHAR(50) NOT NULL,
+                summary TEXT NOT NULL,
+                created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                INDEX idx_created_at (created_at)
+            ) ENGINE=InnoDB;
+            """)
+            
+            # Create search result cache table
+            cursor.execute("""
+            CREATE TABLE IF NOT EXISTS search_cache (
+                id INT AUTO_INCREMENT PRIMARY KEY,
+                cache_key VARCHAR(64) NOT NULL UNIQUE,
+                provider VARCHAR(20) NOT NULL,
+                results MEDIUMTEXT NOT NULL,
+                created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                expires_at DATETIME NOT NULL,
+                INDEX idx_expires_at (expires_at)
+            ) ENGINE=InnoDB;
+            """)
+            
+            # Create digests table
+            cursor.execute("""
+            CREATE TABLE IF NOT EXISTS digests (
+                id INT AUTO_INCREMENT PRIMARY KEY,
+                preference_id INT NOT NULL,
+                preference_version DATETIME NOT NULL,
+                content MEDIUMTEXT NOT NULL,
+                built_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (preference_id) REFERENCES preferences(id) ON DELETE CASCADE,
+                INDEX idx_preference_built (preference_id, built_at)
+            ) ENGINE=InnoDB;
+            """)
+            
+            # Create articles table
+            cursor.execute("""
+            CREATE TABLE IF NOT EXISTS articles (
+                id INT AUTO_INCREMENT PRIMARY KEY,
+                url_hash VARCHAR(64) NOT NULL UNIQUE,
+                url VARCHAR(2048) NOT NULL,
+                canonical_url VARCHAR(2048) NOT NULL,
+                source VARCHAR(255) NOT NULL,
+                source_name VARCHAR(100) NOT NULL,
+                published_date DATE NOT NULL,
+                title VARCHAR(500) NOT NULL,
+                snippet TEXT NULL,
+                content MEDIUMTEXT NULL,
+                fetched_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                INDEX idx_source_published (source, published_date),
+                FULLTEXT INDEX ft_article_text (title, snippet, content)
+            ) ENGINE=InnoDB;
+            """)
+            
+            # Create fetched windows table
+            cursor.execute("""
+            CREATE TABLE IF NOT EXISTS fetched_windows (
+                id INT AUTO_INCREMENT PRIMARY KEY,
+                query_hash VARCHAR(64) NOT NULL,
+                source VARCHAR(255) NOT NULL,
+                day DATE NOT NULL,
+                fetched_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                UNIQUE KEY uq_query_source_day (query_hash, source, day)
+            ) ENGINE=InnoDB;
+            """)
+            
+            # Create provider quotas table
+            cursor.execute("""
+            CREATE TABLE IF NOT EXISTS provider_quotas (
+                provider VARCHAR(50) PRIMARY KEY,
+                tokens DOUBLE NOT NULL,
+                refilled_at DOUBLE NOT NULL,
+                day DATE NOT NULL,
+                day_count INT NOT NULL DEFAULT 0,
+                blocked_until DOUBLE NOT NULL DEFAULT 0
             ) ENGINE=InnoDB;
             """)
             
@@ -0,0 +1,88 @@
+import re
+
+# Fingerprint size in bits
+SIMHASH_BITS = 64
+_MASK = (1 << SIMHASH_BITS) - 1
+
+# Only the start of long articles is fingerprinted, which bounds the cost per article
+MAX_WORDS = 300
+
+_WORD_PATTERN = re.compile(r'\w+')
+
+def _features(text, ngram=3):
+    """Split text into word n-gram shingles"""
+    words = _WORD_PATTERN.findall(text.lower())[:MAX_WORDS]
+    if len(words) < ngram:
+        return set(words)
+    return {' '.join(words[i:i + ngram]) for i in range(len(words) - ngram + 1)}
+
+def simhash(text):
+    """
+    Compute the 64-bit SimHash fingerprint of a text.
+
+    Args:
+        text: Text to fingerprint
+
+    Returns:
+        int: Fingerprint; similar texts differ in few bits
+    """
+    features = _features(text)
+    if not features:
+        return 0
+
+    # Fingerprints are only compared within one process, so the built-in
+    # (SipHash) string hash is enough. Counting ones per bit column is done
+    # by zip/str.count instead of a Python loop over 64 bits per feature
+    bits = [format(hash(feature) & _MASK, '064b') for feature in features]
+    half = len(bits) / 2
+
+    fingerprint = 0
+    for column in zip(*bits):
+        fingerprint = (fingerprint << 1) | (column.count('1') > half)
+    return fingerprint
+
+def similarity(fingerprint_a, fingerprint_b):
+    """
+    Get the similarity of two fingerprints.
+
+    Returns:
+        float: 1.0 for identical fingerprints, 0.0 when every bit differs
+    """
+    distance = bin(fingerprint_a ^ fingerprint_b).count('1')
+    return 1 - distance / SIMHASH_BITS
+
+def collapse_near_duplicates(articles, threshold=0.9):
+    """
+    Collapse near-duplicate articles (e.g. syndicated wire stories) into one.
+
+    The first article of each cluster is kept as its representative; the
+    others are attached to it under 'alternate_sources' so they can still
+    be cited.
+
+    Args:
+        articles: List of article dictionaries, in order of preference
+        threshold: Minimum fingerprint similarity for two articles to count as duplicates
+
+    Returns:
+        list: Representative articles in their original order
+    """
+    representatives = []
+    fingerprints = []
+
+    for article in articles:
+        fingerprint = simhash(f"{article.get('title', '')} {article.get('content', '')}")
+
+        for index, other in enumerate(fingerprints):
+            if similarity(fingerprint, other) >= threshold:
+                representatives[index].setdefault('alternate_sources', []).append({
+                    'title': article.get('title', ''),
+                    'source': article.get('source', ''),
+                    'url': article.get('url', ''),
+                    'date': article.get('display_date', article.get('date', ''))
+                })
+                break
+        else:
+            representatives.append(article)
+            fingerprints.append(fingerprint)
+
+    return representatives
@@ -0,0 +1,186 @@
+import logging
+import time
+from datetime import datetime, timedelta
+from flask import current_app
+from sqlalchemy import func, or_
+from app import db
+from app.models.digest import Digest
+from app.models.preference import Preference
+from app.utils.article_search import search_for_articles
+from app.utils.perplexity_api import get_article_summaries, iter_article_summaries, build_citations
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+def get_current_digest(preference):
+    """
+    Get the latest digest built from the preference's current settings.
+
+    Args:
+        preference: The user preference object
+
+    Returns:
+        Digest: The digest, or None if it is missing or out of date
+    """
+    digest = (
+        Digest.query
+        .filter_by(preference_id=preference.id)
+        .order_by(Digest.built_at.desc())
+        .first()
+    )
+
+    if digest and digest.is_current_for(preference):
+        return digest
+    return None
+
+def build_digest(preference):
+    """
+    Run the search and summarize pipeline for a preference and store the result.
+
+    Args:
+        preference: The user preference object
+
+    Returns:
+        dict: A dictionary containing article summaries and citations
+    """
+    # Remember the version up front so edits made while we build mark the digest stale
+    preference_version = preference.updated_at or datetime.utcnow()
+    summaries = get_article_summaries(preference)
+    store_digest(preference.id, preference_version, summaries)
+    return summaries
+
+def stream_digest(preference):
+    """
+    Search for articles now and summarize them progressively.
+
+    The digest is stored once the last summary has been produced.
+
+    Args:
+        preference: The user preference object
+
+    Returns:
+        tuple: (citations, number of articles, generator of summary events).
+            Each event is the summary dictionary plus its article 'index'.
+    """
+    preference_version = preference.updated_at or datetime.utcnow()
+    preference_id = preference.id
+    articles = search_for_articles(preference)
+    citations = build_citations(articles)
+
+    def generate():
+        summaries = [None] * len(articles)
+        for index, summary in iter_article_summaries(articles):
+            summaries[index] = summary
+            yield dict(summary, index=index)
+
+        store_digest(preference_id, preference_version, {
+            'summaries': summaries,
+            'citations': citations
+        })
+
+    return citations, len(articles), generate()
+
+def store_digest(preference_id, preference_version, summaries):
+    """
+    Store a digest, replacing older digests of the same preference.
+
+    Digests with summaries that fell back to a mock after an API failure are
+    not stored, so the next request or worker pass retries them instead of
+    serving the placeholder until the preference changes.
+
+    Args:
+        preference_id: ID of the preference the digest belongs to
+        preference_version: Preference.updated_at the digest was built from
+        summaries: A dictionary containing article summaries and citations
+    """
+    failed = sum(1 for summary in summaries.get('summaries', []) if summary and summary.get('is_fallback'))
+    if failed:
+        logger.warning(f"Not storing digest for preference {preference_id}: {failed} summaries failed")
+        return
+
+    try:
+        digest = Digest(preference_id, preference_version, summaries)
+        db.session.add(digest)
+        db.session.flush()
+
+        # Keep only the newest digest for the preference
+        Digest.query.filter(
+            Digest.preference_id == preference_id,
+            Digest.id != digest.id
+        ).delete(synchronize_session=False)
+
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        logger.error(f"Error storing digest for preference {preference_id}: {str(e)}")
+
+def find_stale_preferences(max_age):
+    """
+    Find preferences whose digest is missing, out of date or older than max_age.
+
+    Args:
+        max_age: Maximum age of a digest in seconds
+
+    Returns:
+        list: Preference objects that need a new digest
+    """
+    latest = (
+        db.session.query(
+            Digest.preference_id.label('preference_id'),
+            func.max(Digest.preference_version).label('preference_version'),
+            func.max(Digest.built_at).label('built_at')
+        )
+        .group_by(Digest.preference_id)
+        .subquery()
+    )
+
+    cutoff = datetime.utcnow() - timedelta(seconds=max_age)
+
+    return (
+        Preference.query
+        .outerjoin(latest, latest.c.preference_id == Preference.id)
+        .filter(or_(
+            latest.c.built_at.is_(None),
+            latest.c.preference_version < Preference.updated_at,
+            latest.c.built_at < cutoff
+        ))
+        .order_by(Preference.updated_at.desc())
+        .all()
+    )
+
+def run_worker(poll_interval=None, refresh_interval=None, run_once=False):
+    """
+    Keep every preference's digest up to date.
+
+    Polls the database for preferences that changed through /input or
+    /update_timeframe, or whose digest is older than refresh_interval, and
+    rebuilds them. Must be called inside an application context.
+
+    Args:
+        poll_interval: Seconds to sleep between polls
+        refresh_interval: Maximum age of a digest in seconds
+        run_once: Stop after a single pass
+    """
+    poll_interval = poll_interval or current_app.config.get('DIGEST_POLL_INTERVAL', 15)
+    refresh_interval = refresh_interval or current_app.config.get('DIGEST_REFRESH_INTERVAL', 1800)
+
+    logger.info(f"Digest worker started (poll every {poll_interval}s, refresh after {refresh_interval}s)")
+
+    while True:
+        try:
+            preferences = find_stale_preferences(refresh_interval)
+            for preference in preferences:
+                logger.info(f"Building digest for preference {preference.id}")
+                build_digest(preference)
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"Digest worker pass failed: {str(e)}")
+        finally:
+            # Start the next pass with a fresh session so we see other processes' writes
+            db.session.remove()
+
+        if run_once:
+            return
+
+        time.sleep(poll_interval)
@@ -0,0 +1,140 @@
+import logging
+import math
+import re
+from collections import Counter
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; reduce_content falls back to truncation
+    np = None
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Sentence boundary: end punctuation followed by whitespace and an uppercase letter, digit or quote
+_SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?])\s+(?=["\'“A-Z0-9])|\n+')
+_WORD_PATTERN = re.compile(r'[a-z0-9]+')
+
+# Words that carry no information for ranking sentences
+STOP_WORDS = frozenset("""
+a an and are as at be been but by for from has have he her his i in into is it its of on or our
+said says she that the their them they this to was we were which who will with would you
+""".split())
+
+# TextRank settings
+DAMPING = 0.85
+ITERATIONS = 30
+
+def estimate_tokens(text):
+    """Roughly estimate the number of tokens in text (about 4 characters per token)"""
+    return len(text) // 4 + 1
+
+def split_sentences(text):
+    """
+    Split text into sentences.
+
+    Args:
+        text: Article text
+
+    Returns:
+        list: Non-empty sentences in their original order
+    """
+    return [sentence.strip() for sentence in _SENTENCE_BOUNDARY.split(text) if sentence.strip()]
+
+def _tokenize(sentence):
+    return [word for word in _WORD_PATTERN.findall(sentence.lower()) if word not in STOP_WORDS]
+
+def rank_sentences(sentences):
+    """
+    Rank sentences with TextRank over their TF-IDF vectors.
+
+    Args:
+        sentences: List of sentences
+
+    Returns:
+        list: A score per sentence; higher is more central to the text
+    """
+    tokenized = [_tokenize(sentence) for sentence in sentences]
+    vocabulary = {}
+    for words in tokenized:
+        for word in words:
+            vocabulary.setdefault(word, len(vocabulary))
+
+    if not vocabulary or len(sentences) < 2:
+        return [1.0] * len(sentences)
+
+    # Term frequency matrix, one row per sentence
+    tf = np.zeros((len(sentences), len(vocabulary)))
+    for row, words in enumerate(tokenized):
+        for word, count in Counter(words).items():
+            tf[row, vocabulary[word]] = count
+
+    # TF-IDF with L2-normalized rows, so the dot product is the cosine similarity
+    document_frequency = np.count_nonzero(tf, axis=0)
+    tfidf = tf * np.log((1 + len(sentences)) / (1 + document_frequency)) + tf
+    norms = np.linalg.norm(tfidf, axis=1, keepdims=True)
+    tfidf = np.divide(tfidf, norms, out=np.zeros_like(tfidf), where=norms > 0)
+
+    similarity = tfidf @ tfidf.T
+    np.fill_diagonal(similarity, 0)
+
+    # Row-normalize into a transition matrix; sentences without links jump uniformly
+    out_weight = similarity.sum(axis=1, keepdims=True)
+    transition = np.divide(similarity, out_weight, out=np.full_like(similarity, 1 / len(sentences)), where=out_weight > 0)
+
+    scores = np.full(len(sentences), 1 / len(sentences))
+    for _ in range(ITERATIONS):
+        scores = (1 - DAMPING) / len(sentences) + DAMPING * (transition.T @ scores)
+
+    return scores.tolist()
+
+def reduce_content(text, token_budget):
+    """
+    Shrink text to a token budget by keeping its most informative sentences.
+
+    Sentences are ranked with TextRank and the best ones that fit the budget
+    are kept in their original order. Without numpy the text is truncated
+    to the budget instead.
+
+    Args:
+        text: Article text
+        token_budget: Maximum estimated tokens of the result
+
+    Returns:
+        str: The reduced text (the original text if it already fits)
+    """
+    if estimate_tokens(text) <= token_budget:
+        return text
+
+    max_chars = token_budget * 4
+    if np is None:
+        return text[:max_chars]
+
+    sentences = split_sentences(text)
+    if len(sentences) < 2:
+        return text[:max_chars]
+
+    try:
+        scores = rank_sentences(sentences)
+    except Exception as e:
+        logger.warning(f"Error ranking sentences, truncating instead: {str(e)}")
+        return text[:max_chars]
+
+    # The lead sentence usually states the story; break ties toward earlier sentences
+    scores[0] = math.inf
+    order = sorted(range(len(sentences)), key=lambda index: (-scores[index], index))
+
+    selected = set()
+    used = 0
+    for index in order:
+        length = len(sentences[index]) + 1
+        if used + length > max_chars:
+            continue
+        selected.add(index)
+        used += length
+
+    if not selected:
+        return text[:max_chars]
+
+    return ' '.join(sentences[index] for index in sorted(selected))
@@ -0,0 +1,204 @@
+import logging
+import threading
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from flask import current_app
+from app.utils.provider_health import get_breaker, CircuitOpenError
+from app.utils.quota import acquire
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Base URL of every provider we talk to; each gets its own pooled adapter
+PROVIDER_URLS = {
+    'google': 'https://www.googleapis.com/',
+    'newsapi': 'https://newsapi.org/',
+    'google_news': 'https://news.google.com/',
+    'perplexity': 'https://api.perplexity.ai/'
+}
+
+# Providers whose connections are opened ahead of the first request
+PREWARM_PROVIDERS = ['google', 'newsapi', 'perplexity']
+
+_session = None
+_session_lock = threading.Lock()
+
+def _build_retry(retries, idempotent=True):
+    """
+    Build the transport-level retry policy for a provider.
+
+    Non-idempotent providers (POST APIs) only retry failed connection
+    attempts, which never reached the server.
+    """
+    if not idempotent:
+        return Retry(total=retries, connect=retries, read=0, status=0, raise_on_status=False)
+
+    return Retry(
+        total=retries,
+        connect=retries,
+        read=retries,
+        status=retries,
+        backoff_factor=0.3,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset(['GET', 'HEAD']),
+        raise_on_status=False
+    )
+
+def _build_session(config):
+    """Create a session with one connection pool per provider host"""
+    session = requests.Session()
+    pool_connections = config.get('HTTP_POOL_CONNECTIONS', 10)
+    pool_maxsize = config.get('HTTP_POOL_MAXSIZE', 20)
+    retries = config.get('HTTP_RETRIES', {})
+
+    # Default adapter for any other host (e.g. publisher pages)
+    default_adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=_build_retry(retries.get('default', 1))
+    )
+    session.mount('https://', default_adapter)
+    session.mount('http://', default_adapter)
+
+    for provider, base_url in PROVIDER_URLS.items():
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=pool_maxsize,
+            max_retries=_build_retry(retries.get(provider, 1), idempotent=provider != 'perplexity')
+        )
+        session.mount(base_url, adapter)
+
+    return session
+
+def get_session():
+    """
+    Get the process-wide HTTP session.
+
+    Returns:
+        requests.Session: Shared session with pooled keep-alive connections
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _build_session(current_app.config)
+    return _session
+
+def get_timeout(provider):
+    """
+    Get the (connect, read) timeout for a provider.
+
+    Args:
+        provider: Provider name
+
+    Returns:
+        tuple: Connect and read timeouts in seconds
+    """
+    timeouts = current_app.config.get('HTTP_TIMEOUTS', {})
+    return tuple(timeouts.get(provider, timeouts.get('default', (3.05, 10))))
+
+def _is_healthy_response(response):
+    """Whether a response shows the provider working (client errors other than auth and rate limits count as working)"""
+    return response.status_code < 500 and response.status_code not in (401, 403, 429)
+
+def reserve_request(provider, cost=1):
+    """
+    Claim a request through the provider's circuit breaker, then spend its quota token.
+
+    Claiming the circuit first means a half-open circuit lets only its
+    probe spend quota, and an open one none. Send the reserved request with
+    reserved=True so the breaker is not asked again.
+
+    Args:
+        provider: Provider name
+        cost: Quota tokens the request uses
+
+    Returns:
+        bool: True if the request may be sent, False if the quota is exhausted
+
+    Raises:
+        CircuitOpenError: If the provider's circuit is open
+    """
+    breaker = get_breaker(provider)
+    if breaker is not None and not breaker.allow():
+        raise CircuitOpenError(f"Circuit for {provider} is open")
+
+    if acquire(provider, cost):
+        return True
+
+    if breaker is not None:
+        breaker.release()
+    return False
+
+def _send(provider, method, url, reserved=False, **kwargs):
+    """Send a request, passing it through the provider's circuit breaker unless reserve_request already did"""
+    kwargs.setdefault('timeout', get_timeout(provider))
+
+    breaker = get_breaker(provider)
+    if breaker is None:
+        return get_session().request(method, url, **kwargs)
+
+    if not reserved and not breaker.allow():
+        raise CircuitOpenError(f"Circuit for {provider} is open")
+
+    # Record every allowed request, whatever it raises, or a half-open circuit never gets its probe back
+    started = time.monotonic()
+    healthy = False
+    try:
+        response = get_session().request(method, url, **kwargs)
+        healthy = _is_healthy_response(response)
+        return response
+    finally:
+        breaker.record(healthy, time.monotonic() - started)
+
+def http_get(provider, url, **kwargs):
+    """
+    Send a GET request through the shared session.
+
+    Args:
+        provider: Provider name used to pick the timeout
+        url: URL to request
+        **kwargs: Extra arguments passed to requests; reserved=True for a request claimed with reserve_request
+
+    Returns:
+        requests.Response: The response
+    
+    Raises:
+        CircuitOpenError: If the provider's circuit is open
+    """
+    return _send(provider, 'GET', url, **kwargs)
+
+def http_post(provider, url, **kwargs):
+    """
+    Send a POST request through the shared session.
+
+    Args:
+        provider: Provider name used to pick the timeout
+        url: URL to request
+        **kwargs: Extra arguments passed to requests; reserved=True for a request claimed with reserve_request
+
+    Returns:
+        requests.Response: The response
+    
+    Raises:
+        CircuitOpenError: If the provider's circuit is open
+    """
+    return _send(provider, 'POST', url, **kwargs)
+
+def prewarm_connections(providers=None):
+    """
+    Open a keep-alive connection to each provider host ahead of the first request.
+
+    Args:
+        providers: Provider names to warm up. Defaults to PREWARM_PROVIDERS.
+    """
+    for provider in providers or PREWARM_PROVIDERS:
+        try:
+            # Any response will do; we only want the TCP+TLS handshake done
+            get_session().head(PROVIDER_URLS[provider], timeout=get_timeout(provider), allow_redirects=False)
+            logger.info(f"Pre-warmed connection to {PROVIDER_URLS[provider]}")
+        except requests.exceptions.RequestException as e:
+            logger.warning(f"Could not pre-warm connection to {PROVIDER_URLS[provider]}: {str(e)}")
@@ -0,0 +1,170 @@
+import atexit
+import logging
+import threading
+import time
+from flask import current_app
+from app.utils.db_helper import get_db_connection
+from app.utils.user_cache import invalidate_user
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+class LoginTracker:
+    """
+    Write-behind buffer for last-login times.
+
+    Logins only record the time in memory; a background thread writes all
+    buffered times with a single UPDATE every flush interval, and once more
+    when the process exits. Times of a failed flush go back into the buffer
+    and are written by the next one.
+    """
+
+    # Users updated per statement
+    BATCH_SIZE = 500
+
+    def __init__(self):
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._app = None
+        self._thread = None
+        self.recorded = 0
+        self.flushes = 0
+        self.written = 0
+        self.failed_flushes = 0
+
+    def record(self, user_id, when):
+        """
+        Buffer a login, starting the flush thread on first use.
+
+        Args:
+            user_id: ID of the user who logged in
+            when: Login time
+        """
+        with self._lock:
+            # Later logins of the same user replace earlier ones
+            self._pending[user_id] = when
+            self.recorded += 1
+            if self._thread is None:
+                self._start(current_app._get_current_object())
+
+    def _start(self, app):
+        self._app = app
+        self._thread = threading.Thread(target=self._run, name='login-tracker', daemon=True)
+        self._thread.start()
+        atexit.register(self.flush)
+
+    def _run(self):
+        interval = self._app.config.get('LAST_LOGIN_FLUSH_INTERVAL', 5)
+        while True:
+            time.sleep(interval)
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Error flushing last login times: {str(e)}")
+
+    def flush(self):
+        """
+        Write all buffered login times.
+
+        Returns:
+            int: Number of users updated
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return 0
+
+        try:
+            with self._app.app_context():
+                written = self._write(list(pending.items()))
+        except Exception as e:
+            logger.warning(f"Error writing {len(pending)} last login times, retrying next flush: {str(e)}")
+            with self._lock:
+                # Logins recorded in the meantime are newer
+                for user_id, when in pending.items():
+                    self._pending.setdefault(user_id, when)
+                self.failed_flushes += 1
+            return 0
+
+        # Cached identities still carry the previous last_login
+        for user_id in pending:
+            invalidate_user(user_id)
+
+        with self._lock:
+            self.flushes += 1
+            self.written += written
+        return written
+
+    def _write(self, logins):
+        """
+        Update last_login of several users with one statement per BATCH_SIZE users.
+
+        Joins users against a derived table of the buffered times, and only
+        moves last_login forward, whatever order processes flush in.
+
+        Args:
+            logins: (user_id, login time) tuples
+
+        Returns:
+            int: Number of users updated
+
+        Raises:
+            Exception: If the database could not be reached or the update failed
+        """
+        connection = get_db_connection()
+        if connection is None:
+            raise RuntimeError("No database connection")
+
+        written = 0
+        try:
+            with connection.cursor() as cursor:
+                for offset in range(0, len(logins), self.BATCH_SIZE):
+                    batch = logins[offset:offset + self.BATCH_SIZE]
+                    rows = ' UNION ALL '.join(
+                        ['SELECT %s AS id, CAST(%s AS DATETIME) AS last_login'] + ['SELECT %s, %s'] * (len(batch) - 1)
+                    )
+                    written += cursor.execute(f"""
+                    UPDATE users u
+                    JOIN ({rows}) AS logins ON u.id = logins.id
+                    SET u.last_login = logins.last_login
+                    WHERE u.last_login IS NULL OR u.last_login < logins.last_login
+                    """, [value for login in batch for value in login])
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            connection.close()
+
+        return written
+
+    def get_stats(self):
+        """Get the number of buffered, recorded and written logins, and of failed flushes"""
+        with self._lock:
+            return {
+                'pending': len(self._pending),
+                'recorded': self.recorded,
+                'flushes': self.flushes,
+                'failed_flushes': self.failed_flushes,
+                'written': self.written
+            }
+
+# Shared tracker instance
+login_tracker = LoginTracker()
+
+def record_login(user_id, when):
+    """
+    Record a login time, buffered unless write-behind is disabled.
+
+    Args:
+        user_id: ID of the user who logged in
+        when: Login time
+
+    Returns:
+        bool: True if buffered, False if the caller should write it now
+    """
+    if not current_app.config.get('LAST_LOGIN_WRITE_BEHIND', True):
+        return False
+    login_tracker.record(user_id, when)
+    return True
@@ -8,19 +8,132 @@ import logging
 from datetime import datetime
 from flask import current_app
 from app.utils.article_search import search_for_articles
+from app.utils.article_fetcher import fetch_article_bodies
+from app.utils.concurrency import run_concurrently, iter_concurrently
+from app.utils.extractive import estimate_tokens, reduce_content
+from app.utils.http_client import http_post, reserve_request
+from app.utils.quota import report_exhausted, QuotaExhausted
+from app.utils.summary_cache import summary_cache, SummaryCache
+from app.utils.single_flight import SingleFlight
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Coalesces concurrent requests to summarize the same content
+summary_flight = SingleFlight()
+
 class PerplexityAPI:
     """Handles interaction with Perplexity API for article summarization"""
-    def __init__(self, api_key: str):
+    
+    # Create a clear, specific prompt for better summaries
+    SYSTEM_PROMPT = (
+        "You are a skilled content summarizer that extracts key points from articles."
+        "Your summaries should be presented as bullet points, each starting with '•'."
+        "Focus on extracting factual information, key insights, and main arguments."
+        "Make sure each bullet point is self-contained and conveys a complete thought."
+        "Be concise and avoid repetition. Use clear language."
+    )
+    
+    # Output contract for several articles packed into one request
+    BATCH_SYSTEM_PROMPT = SYSTEM_PROMPT + (
+        " You will receive several articles, each introduced by a line of the form 'ARTICLE <id>'."
+        " Summarize every article separately and respond with JSON only, in the form"
+        " {\"summaries\": [{\"id\": \"<id>\", \"bullets\": [\"...\", \"...\"]}]},"
+        " with exactly one entry per article id."
+    )
+    BATCH_RESPONSE_FORMAT = {
+        "type": "json_schema",
+        "json_schema": {
+            "schema": {
+                "type": "object",
+                "properties": {
+                    "summaries": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "id": {"type": "string"},
+                                "bullets": {"type": "array", "items": {"type": "string"}}
+                            },
+                            "required": ["id", "bullets"]
+                        }
+                    }
+                },
+                "required": ["summaries"]
+            }
+        }
+    }
+    
+    def __init__(self, api_key: str, cache=None, input_token_budget=800, min_output_tokens=200, max_output_tokens=800):
         self.api_key = api_key
         self.base_url = "https://api.perplexity.ai/chat/completions"
+        self.model = "sonar"
+        self.max_tokens = max_output_tokens
+        self.min_tokens = min_output_tokens
+        self.input_token_budget = input_token_budget
         self.retries = 3
         self.backoff_factor = 1.5
+        self.cache = cache
+        
+    def _post_with_retries(self, headers, payload):
+        """
+        Send a chat completion request with exponential backoff on failures.
+        
+        Returns:
+            requests.Response: The last response received
         
+        Raises:
+            requests.exceptions.RequestException: If every attempt failed to connect
+            QuotaExhausted: If the Perplexity request budget is used up
+            CircuitOpenError: If the Perplexity circuit is open
+        """
+        max_retries = self.retries
+        retry_delay = 1
+        
+        for attempt in range(max_retries):
+            # Give up right away rather than sleeping on a request we may not make;
+            # the circuit is claimed first so an open one does not spend a quota token
+            if not reserve_request('perplexity'):
+                raise QuotaExhausted('perplexity')
+            
+            try:
+                response = http_post(
+                    'perplexity',
+                    self.base_url,
+                    headers=headers,
+                    json=payload,
+                    reserved=True
+                )
+                
+                if response.status_code == 200:
+                    break
+                
+                if response.status_code == 429:
+                    report_exhausted('perplexity', response.headers.get('Retry-After'))
+                    raise QuotaExhausted('perplexity')
+                    
+                logger.warning(f"API request failed (attempt {attempt+1}): Status {response.status_code}")
+                retry_delay *= 2  # Exponential backoff
+                time.sleep(retry_delay + random.uniform(0, 1))
+            except requests.exceptions.RequestException as e:
+                logger.warning(f"API request exception (attempt {attempt+1}): {str(e)}")
+                if attempt == max_retries - 1:
+                    raise
+                retry_delay *= 2  # Exponential backoff
+                time.sleep(retry_delay + random.uniform(0, 1))
+        
+        return response
+    
+    def prepare_content(self, content):
+        """Reduce content to the input token budget, keeping its most informative sentences"""
+        return reduce_content(content, self.input_token_budget)
+    
+    def output_tokens_for(self, content):
+        """Scale the output token limit with the size of the content, from the minimum up to the maximum at a full input budget"""
+        fill = min(1.0, estimate_tokens(content) / max(1, self.input_token_budget))
+        return int(self.min_tokens + (self.max_tokens - self.min_tokens) * fill)
+    
     def generate_summary(self, content: str) -> str:
         """
         Generate article summary using Perplexity AI API with Sonar model
@@ -34,110 +147,271 @@ class PerplexityAPI:
             return "• No content available for summarization"
 
         try:
-            # Truncate content if too long to avoid exceeding token limits
-            max_content_length = 5000
-            truncated_content = content[:max_content_length] if len(content) > max_content_length else content
+            # Reduce long content to its key sentences to stay within the token budget
+            truncated_content = self.prepare_content(content)
+            max_tokens = self.output_tokens_for(truncated_content)
             
-            logger.info(f"Generating summary using Perplexity API, content length: {len(truncated_content)} chars")
+            # Serve identical requests from the cache
+            cache_key = SummaryCache.make_key(truncated_content, self.model, self.SYSTEM_PROMPT, max_tokens)
+            if self.cache:
+                cached_summary = self.cache.get(cache_key)
+                if cached_summary:
+                    logger.info("Using cached summary")
+                    return cached_summary
+            
+            # Concurrent requests for the same content share one API call
+            return summary_flight.do(
+                cache_key,
+                lambda: self._request_summary(truncated_content, max_tokens, cache_key)
+            )
 
-            # Create a clear, specific prompt for better summaries
-            messages = [
-                {
-                    "role": "system",
-                    "content": (
-                        "You are a skilled content summarizer that extracts key points from articles."
-                        "Your summaries should be presented as bullet points, each starting with '•'."
-                        "Focus on extracting factual information, key insights, and main arguments."
-                        "Make sure each bullet point is self-contained and conveys a complete thought."
-                        "Be concise and avoid repetition. Use clear language."
-                    )
-                },
-                {
-                    "role": "user",
-                    "content": truncated_content
-                }
-            ]
+        except QuotaExhausted:
+            logger.warning("Perplexity quota exhausted, skipping summary")
+            return "• Error: Summary quota exhausted, please try again later"
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Request Exception: {str(e)}")
+            return f"• Error: Failed to connect to API: {str(e)}"
+        except Exception as e:
+            logger.error(f"Unexpected Error: {str(e)}")
+            return f"• Error: {str(e)}"
 
-            # API request headers
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
+    def _request_summary(self, truncated_content, max_tokens, cache_key):
+        """
+        Request a summary from the API and cache it.
+        
+        Returns:
+            str: Summary text in '•' bullet format, or an '• Error:' message
+        """
+        logger.info(f"Generating summary using Perplexity API, content length: {len(truncated_content)} chars")
 
-            # API request payload using simplified sonar model
-            payload = {
-                "model": "sonar",
-                "messages": messages,
-                "max_tokens": 800
+        messages = [
+            {
+                "role": "system",
+                "content": self.SYSTEM_PROMPT
+            },
+            {
+                "role": "user",
+                "content": truncated_content
             }
+        ]
+
+        # API request headers
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+
+        # API request payload using simplified sonar model
+        payload = {
+            "model": self.model,
+            "messages": messages,
+            "max_tokens": max_tokens
+        }
 
-            # Log payload for debugging (without the actual content)
-            logger.info(f"API payload: model={payload['model']}, max_tokens={payload['max_tokens']}")
+        # Log payload for debugging (without the actual content)
+        logger.info(f"API payload: model={payload['model']}, max_tokens={payload['max_tokens']}")
 
-            # Make API request with retry logic
-            max_retries = 3
-            retry_delay = 1
+        # Make API request with retry logic
+        request_started = time.time()
+        response = self._post_with_retries(headers, payload)
+
+        if response.status_code != 200:
+            error_msg = f"API Error (Status {response.status_code})"
+            try:
+                error_detail = response.json()
+                logger.error(f"API error details: {json.dumps(error_detail)}")
+            except:
+                logger.error(f"API error response: {response.text}")
+            return f"• Error: {error_msg}, please try again later"
+
+        result = response.json()
+        if 'choices' in result and result['choices']:
+            summary = result['choices'][0]['message']['content'].strip()
             
-            for attempt in range(max_retries):
-                try:
-                    response = requests.post(
-                        self.base_url,
-                        headers=headers,
-                        json=payload,
-                        timeout=45
-                    )
-                    
-                    if response.status_code == 200:
-                        break
-                        
-                    logger.warning(f"API request failed (attempt {attempt+1}): Status {response.status_code}")
-                    retry_delay *= 2  # Exponential backoff
-                    time.sleep(retry_delay + random.uniform(0, 1))
-                except requests.exceptions.RequestException as e:
-                    logger.warning(f"API request exception (attempt {attempt+1}): {str(e)}")
-                    if attempt == max_retries - 1:
-                        raise
-                    retry_delay *= 2  # Exponential backoff
-                    time.sleep(retry_delay + random.uniform(0, 1))
+            # Ensure summary is in bullet points
+            if not summary.startswith('•'):
+                # Convert to bullet points
+                lines = summary.split('\n')
+                formatted_lines = []
+                for line in lines:
+                    line = line.strip()
+                    if line:
+                        # Remove numbering if present
+                        line = re.sub(r'^\d+\.\s*', '', line)
+                        formatted_lines.append(f"• {line}")
+                summary = '\n'.join(formatted_lines)
+            
+            logger.info("Successfully generated summary")
+            if self.cache:
+                self.cache.record_api_call(time.time() - request_started)
+                self.cache.set(cache_key, summary, self.model)
+            return summary
+        else:
+            logger.error(f"Unexpected API response structure: {result}")
+            return "• Error: Unexpected API response format"
 
+    def plan_batches(self, contents, token_budget, max_articles, output_tokens_per_article):
+        """
+        Group contents into batches that fit the request token budget.
+        
+        Each content is reduced to the input token budget once here; the
+        batches carry the reduced text so summarizing them does not rank
+        the sentences again.
+        
+        Args:
+            contents: List of article contents, in order
+            token_budget: Maximum prompt plus output tokens per request
+            max_articles: Maximum number of articles per request
+            output_tokens_per_article: Output tokens reserved for each article
+        
+        Returns:
+            list: Batches as lists of (index into contents, reduced content) tuples
+        """
+        prompt_tokens = estimate_tokens(self.BATCH_SYSTEM_PROMPT)
+        batches = []
+        current = []
+        current_tokens = prompt_tokens
+        
+        for index, content in enumerate(contents):
+            reduced_content = self.prepare_content(content)
+            cost = estimate_tokens(reduced_content) + output_tokens_per_article
+            if current and (current_tokens + cost > token_budget or len(current) >= max_articles):
+                batches.append(current)
+                current = []
+                current_tokens = prompt_tokens
+            current.append((index, reduced_content))
+            current_tokens += cost
+        
+        if current:
+            batches.append(current)
+        
+        return batches
+    
+    def generate_batch_summaries(self, items, output_tokens_per_article=200):
+        """
+        Summarize several articles with a single chat completion.
+        
+        Args:
+            items: List of (article id, content) tuples
+            output_tokens_per_article: Output tokens reserved for each article
+        
+        Returns:
+            dict: Summary text in '•' bullet format per article id. Articles
+                missing from the response (or a failed request) are left out
+                so the caller can fall back to generate_summary.
+        """
+        if not self.api_key or not items:
+            return {}
+        
+        summaries = {}
+        pending = []
+        
+        # Serve articles we have already summarized from the cache; content
+        # from plan_batches already fits the budget and passes through as is
+        for article_id, content in items:
+            truncated_content = self.prepare_content(content)
+            cache_key = None
+            if self.cache:
+                cache_key = self.cache.make_key(truncated_content, self.model, self.BATCH_SYSTEM_PROMPT, output_tokens_per_article)
+                cached_summary = self.cache.get(cache_key)
+                if cached_summary:
+                    summaries[article_id] = cached_summary
+                    continue
+            pending.append((str(article_id), truncated_content, cache_key))
+        
+        if not pending:
+            return summaries
+        
+        user_content = "\n\n".join(f"ARTICLE {article_id}\n{content}" for article_id, content, _ in pending)
+        
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+        
+        payload = {
+            "model": self.model,
+            "messages": [
+                {
+                    "role": "system",
+                    "content": self.BATCH_SYSTEM_PROMPT
+                },
+                {
+                    "role": "user",
+                    "content": user_content
+                }
+            ],
+            "max_tokens": output_tokens_per_article * len(pending),
+            "response_format": self.BATCH_RESPONSE_FORMAT
+        }
+        
+        logger.info(f"Generating {len(pending)} summaries in one request, content length: {len(user_content)} chars")
+        
+        try:
+            request_started = time.time()
+            response = self._post_with_retries(headers, payload)
+            
             if response.status_code != 200:
-                error_msg = f"API Error (Status {response.status_code})"
-                try:
-                    error_detail = response.json()
-                    logger.error(f"API error details: {json.dumps(error_detail)}")
-                except:
-                    logger.error(f"API error response: {response.text}")
-                return f"• Error: {error_msg}\n• Please try again later"
-
+                logger.error(f"Batch API request failed: Status {response.status_code}")
+                return summaries
+            
             result = response.json()
-            if 'choices' in result and result['choices']:
-                summary = result['choices'][0]['message']['content'].strip()
-                
-                # Ensure summary is in bullet points
-                if not summary.startswith('•'):
-                    # Convert to bullet points
-                    lines = summary.split('\n')
-                    formatted_lines = []
-                    for line in lines:
-                        line = line.strip()
-                        if line:
-                            # Remove numbering if present
-                            line = re.sub(r'^\d+\.\s*', '', line)
-                            formatted_lines.append(f"• {line}")
-                    summary = '\n'.join(formatted_lines)
-                
-                logger.info("Successfully generated summary")
-                return summary
-            else:
-                logger.error(f"Unexpected API response structure: {result}")
-                return "• Error: Unexpected API response format"
-
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Request Exception: {str(e)}")
-            return f"• Error: Failed to connect to API: {str(e)}"
+            content = result['choices'][0]['message']['content']
+            parsed = self._parse_batch_response(content, {article_id for article_id, _, _ in pending})
         except Exception as e:
-            logger.error(f"Unexpected Error: {str(e)}")
-            return f"• Error: {str(e)}"
+            logger.error(f"Batch summarization failed: {str(e)}")
+            return summaries
+        
+        if self.cache:
+            self.cache.record_api_call(time.time() - request_started)
+        
+        for article_id, _, cache_key in pending:
+            if article_id in parsed:
+                summaries[article_id] = parsed[article_id]
+                if self.cache:
+                    self.cache.set(cache_key, parsed[article_id], self.model)
+        
+        logger.info(f"Batch returned {len(parsed)} of {len(pending)} summaries")
+        return summaries
+    
+    def _parse_batch_response(self, content, expected_ids):
+        """
+        Split a batch response into per-article bullet summaries.
+        
+        Args:
+            content: Message content returned by the API
+            expected_ids: Article ids that were sent
+        
+        Returns:
+            dict: Summary text in '•' bullet format per article id
+        """
+        # Tolerate code fences or prose around the JSON object
+        match = re.search(r'\{.*\}', content, re.DOTALL)
+        if not match:
+            raise ValueError("No JSON object in batch response")
+        
+        data = json.loads(match.group(0))
+        summaries = {}
+        
+        for entry in data.get('summaries', []):
+            if not isinstance(entry, dict):
+                continue
+            article_id = str(entry.get('id', '')).strip()
+            bullets = entry.get('bullets')
+            if article_id not in expected_ids or not isinstance(bullets, list):
+                continue
+            
+            lines = []
+            for bullet in bullets:
+                # Remove bullet markers or numbering the model may have added
+                line = re.sub(r'^(?:[•\-*]|\d+\.)\s*', '', str(bullet).strip())
+                if line:
+                    lines.append(f"• {line}")
+            
+            if lines:
+                summaries[article_id] = '\n'.join(lines)
+        
+        return summaries
 
 def get_article_summaries(preference):
     """
@@ -155,63 +429,226 @@ def get_article_summaries(preference):
     # Prepare result structure
     result = {
         'summaries': [],
-        'citations': []
+        'citations': build_citations(articles)
     }
     
+    # Summarize the full article text where the page can be fetched in time
+    fetch_article_bodies(articles)
+    
+    # Generate summaries for each article, several requests at a time, keeping the article order
+    perplexity_client = create_perplexity_client()
+    units = plan_summary_units(perplexity_client, articles)
+    max_workers = current_app.config.get('SUMMARY_MAX_WORKERS', 5)
+    summaries = [None] * len(articles)
+    
+    for unit_results in run_concurrently(
+        lambda unit: summarize_unit(perplexity_client, articles, unit),
+        units,
+        max_workers
+    ):
+        for index, summary in unit_results:
+            summaries[index] = summary
+    
+    result['summaries'] = summaries
+    
+    return result
+
+def iter_article_summaries(articles):
+    """
+    Summarize articles concurrently, yielding each summary as soon as it is ready.
+    
+    Args:
+        articles: List of article dictionaries
+    
+    Yields:
+        tuple: (index of the article, summary dictionary) in completion order
+    """
+    fetch_article_bodies(articles)
+    perplexity_client = create_perplexity_client()
+    units = plan_summary_units(perplexity_client, articles)
+    max_workers = current_app.config.get('SUMMARY_MAX_WORKERS', 5)
+    
+    for _, unit_results in iter_concurrently(
+        lambda unit: summarize_unit(perplexity_client, articles, unit),
+        units,
+        max_workers
+    ):
+        yield from unit_results
+
+def plan_summary_units(perplexity_client, articles):
+    """
+    Split articles into units of work, each summarized by one API request.
+    
+    In batch mode several short articles share a request, sized to the
+    configured token budget; otherwise every article is its own unit.
+    
+    Args:
+        perplexity_client: PerplexityAPI client used for summarization
+        articles: List of article dictionaries
+    
+    Returns:
+        list: Units as lists of (index into articles, content) tuples; batched
+            content is already reduced to the input token budget
+    """
+    config = current_app.config
+    if config.get('SUMMARY_BATCH_MODE', False) and perplexity_client.api_key and len(articles) > 1:
+        return perplexity_client.plan_batches(
+            [article.get('content') or '' for article in articles],
+            config.get('SUMMARY_BATCH_TOKEN_BUDGET', 4000),
+            config.get('SUMMARY_BATCH_MAX_ARTICLES', 5),
+            config.get('SUMMARY_BATCH_OUTPUT_TOKENS', 200)
+        )
+    
+    return [[(index, article.get('content') or '')] for index, article in enumerate(articles)]
+
+def summarize_unit(perplexity_client, articles, unit):
+    """
+    Summarize one unit of articles, falling back to per-article requests.
+    
+    Args:
+        perplexity_client: PerplexityAPI client used for summarization
+        articles: List of article dictionaries
+        unit: (index, content) tuples of the articles to summarize together
+    
+    Returns:
+        list: (index, summary dictionary) tuples for the unit
+    """
+    if len(unit) == 1:
+        index = unit[0][0]
+        return [(index, summarize_article(perplexity_client, articles[index]))]
+    
+    try:
+        batch_summaries = perplexity_client.generate_batch_summaries(
+            [(str(index), content) for index, content in unit],
+            current_app.config.get('SUMMARY_BATCH_OUTPUT_TOKENS', 200)
+        )
+    except Exception as e:
+        logger.error(f"Error generating batch summaries: {str(e)}")
+        batch_summaries = {}
+    
+    results = []
+    for index, _ in unit:
+        summary = None
+        if str(index) in batch_summaries:
+            summary = build_summary(articles[index], batch_summaries[str(index)])
+        
+        # Articles the batch response did not cover get their own request
+        if summary is None:
+            summary = summarize_article(perplexity_client, articles[index])
+        
+        results.append((index, summary))
+    
+    return results
+
+def create_perplexity_client():
+    """
+    Create a Perplexity API client from the app configuration.
+    
+    Returns:
+        PerplexityAPI: Client backed by the persistent summary cache
+    """
+    # Get API key from config
+    api_key = current_app.config['PERPLEXITY_API_KEY']
+    return PerplexityAPI(
+        api_key,
+        cache=summary_cache,
+        input_token_budget=current_app.config.get('SUMMARY_INPUT_TOKEN_BUDGET', 800),
+        min_output_tokens=current_app.config.get('SUMMARY_MIN_OUTPUT_TOKENS', 200),
+        max_output_tokens=current_app.config.get('SUMMARY_MAX_OUTPUT_TOKENS', 800)
+    )
+
+def build_citations(articles):
+    """
+    Build the citation list for a set of articles.
+    
+    Args:
+        articles: List of article dictionaries
+    
+    Returns:
+        list: A citation dictionary per article and per alternate source
+    """
+    citations = []
+    
     # Add each article to the citations
     for article in articles:
-        result['citations'].append({
+        citations.append({
             'title': article['title'],
             'source': article['source'],
             'url': article['url'],
             'date': article.get('display_date', article.get('date', ''))
         })
+        
+        # Near-duplicates collapsed into this article are still cited
+        citations.extend(article.get('alternate_sources', []))
     
-    # Get API key from config
-    api_key = current_app.config['PERPLEXITY_API_KEY']
+    return citations
+
+def summarize_article(perplexity_client, article):
+    """
+    Summarize a single article, falling back to a mock summary.
     
-    # Initialize Perplexity API client
-    perplexity_client = PerplexityAPI(api_key)
+    Args:
+        perplexity_client: PerplexityAPI client used for summarization
+        article: Article data dictionary
     
-    # Generate summaries for each article
-    for article in articles:
-        try:
-            # Use the content of the article for summarization
-            content = article['content']
+    Returns:
+        dict: The summary for the article
+    """
+    try:
+        # Use the content of the article for summarization
+        content = article['content']
+        
+        # If we have a valid API key, try to get a real summary
+        if perplexity_client.api_key:
+            summary_text = perplexity_client.generate_summary(content)
             
-            # If we have a valid API key, try to get a real summary
-            if api_key:
-                summary_text = perplexity_client.generate_summary(content)
-                
-                # Convert bullet points to a list
-                bullet_points = [
-                    point.strip().replace('• ', '', 1) 
-                    for point in summary_text.split('\n') 
-                    if point.strip() and '• Error:' not in point
-                ]
-                
-                # If we got bullet points, use them; otherwise, fall back to mock data
-                if bullet_points:
-                    summary = {
-                        'title': article['title'],
-                        'source': article['source'],
-                        'summary_text': bullet_points,
-                        'article_url': article['url']  # Store the article URL with the summary
-                    }
-                    result['summaries'].append(summary)
-                    continue
+            # If we got bullet points, use them; otherwise, fall back to mock data
+            summary = build_summary(article, summary_text)
+            if summary:
+                return summary
+        
+        # Fall back to mock summaries if API call failed or no API key
+        return _fallback_summary(perplexity_client, article)
             
-            # Fall back to mock summaries if API call failed or no API key
-            mock_summary = generate_mock_summary_for_article(article)
-            result['summaries'].append(mock_summary)
-                
-        except Exception as e:
-            logger.error(f"Error generating summary: {str(e)}")
-            # Fall back to mock summary on error
-            mock_summary = generate_mock_summary_for_article(article)
-            result['summaries'].append(mock_summary)
+    except Exception as e:
+        logger.error(f"Error generating summary: {str(e)}")
+        # Fall back to mock summary on error
+        return _fallback_summary(perplexity_client, article)
+
+def _fallback_summary(perplexity_client, article):
+    """Mock summary for an article; flagged as failed when a real summary was expected, so the digest is not kept"""
+    summary = generate_mock_summary_for_article(article)
+    if perplexity_client.api_key:
+        summary['is_fallback'] = True
+    return summary
+
+def build_summary(article, summary_text):
+    """
+    Build the summary dictionary for an article from API summary text.
     
-    return result
+    Args:
+        article: Article data dictionary
+        summary_text: Summary text in '•' bullet format
+    
+    Returns:
+        dict: The summary, or None if the text has no usable bullet points
+    """
+    # Convert bullet points to a list
+    bullet_points = [
+        point.strip().replace('• ', '', 1) 
+        for point in summary_text.split('\n') 
+        if point.strip() and '• Error:' not in point
+    ]
+    
+    if not bullet_points:
+        return None
+    
+    return {
+        'title': article['title'],
+        'source': article['source'],
+        'summary_text': bullet_points,
+        'article_url': article['url']  # Store the article URL with the summary
+    }
 
 def generate_mock_summary_for_article(article):
     """
@@ -0,0 +1,232 @@
+import logging
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from flask import current_app
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Config keys each provider needs before it can be called
+PROVIDER_REQUIREMENTS = {
+    'google': ['GOOGLE_API_KEY', 'GOOGLE_SEARCH_ENGINE_ID'],
+    'newsapi': ['NEWS_API_KEY'],
+    'google_news': [],
+    'perplexity': ['PERPLEXITY_API_KEY']
+}
+
+class CircuitOpenError(Exception):
+    """Raised when a request is refused because the provider's circuit is open"""
+
+class CircuitBreaker:
+    """
+    Circuit breaker for one provider.
+
+    Closed: requests flow and outcomes are recorded over a sliding window.
+    The circuit opens when the share of failed or slow calls in the window
+    crosses its threshold. Open: requests are refused until open_seconds
+    have passed. Half-open: a single probe request is let through; its
+    outcome closes or reopens the circuit.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, name, window=20, min_calls=5, error_rate=0.5, slow_call_seconds=8.0,
+                 slow_call_rate=0.8, open_seconds=60):
+        self.name = name
+        self.min_calls = min_calls
+        self.error_rate = error_rate
+        self.slow_call_seconds = slow_call_seconds
+        self.slow_call_rate = slow_call_rate
+        self.open_seconds = open_seconds
+
+        self.state = self.CLOSED
+        self._outcomes = deque(maxlen=window)  # (failed, slow) per call
+        self._opened_at = 0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+        self.transitions = deque(maxlen=50)
+
+    def _transition(self, state, reason):
+        self.transitions.append({
+            'time': datetime.utcnow().isoformat(),
+            'from': self.state,
+            'to': state,
+            'reason': reason
+        })
+        logger.warning(f"Circuit for {self.name} {self.state} -> {state}: {reason}")
+
+        self.state = state
+        if state == self.OPEN:
+            self._opened_at = time.monotonic()
+        if state == self.CLOSED:
+            self._outcomes.clear()
+        self._probe_in_flight = False
+
+    def available(self):
+        """Check whether a request would be let through, without claiming the half-open probe"""
+        with self._lock:
+            if self.state == self.OPEN:
+                return time.monotonic() - self._opened_at >= self.open_seconds
+            if self.state == self.HALF_OPEN:
+                return not self._probe_in_flight
+            return True
+
+    def allow(self):
+        """
+        Ask to make a request.
+
+        Returns:
+            bool: True if the request may be made; every allowed request must be recorded
+        """
+        with self._lock:
+            if self.state == self.OPEN:
+                if time.monotonic() - self._opened_at < self.open_seconds:
+                    return False
+                self._transition(self.HALF_OPEN, f"probing after {self.open_seconds}s")
+
+            if self.state == self.HALF_OPEN:
+                if self._probe_in_flight:
+                    return False
+                self._probe_in_flight = True
+
+            return True
+
+    def release(self):
+        """Give back an allowed request that will not be made, without recording an outcome"""
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                self._probe_in_flight = False
+
+    def record(self, success, latency):
+        """
+        Record the outcome of an allowed request.
+
+        Args:
+            success: Whether the provider answered properly
+            latency: Request duration in seconds
+        """
+        slow = latency >= self.slow_call_seconds
+
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                if success and not slow:
+                    self._transition(self.CLOSED, "probe succeeded")
+                else:
+                    self._transition(self.OPEN, "probe failed" if not success else f"probe took {latency:.1f}s")
+                return
+
+            if self.state == self.OPEN:
+                return
+
+            self._outcomes.append((not success, slow))
+            if len(self._outcomes) < self.min_calls:
+                return
+
+            failure_rate, slow_rate = self._rates()
+            if failure_rate >= self.error_rate:
+                self._transition(self.OPEN, f"{failure_rate:.0%} of the last {len(self._outcomes)} calls failed")
+            elif slow_rate >= self.slow_call_rate:
+                self._transition(self.OPEN, f"{slow_rate:.0%} of the last {len(self._outcomes)} calls took over {self.slow_call_seconds}s")
+
+    def _rates(self):
+        if not self._outcomes:
+            return 0.0, 0.0
+        failures = sum(1 for failed, _ in self._outcomes if failed)
+        slow = sum(1 for _, is_slow in self._outcomes if is_slow)
+        return failures / len(self._outcomes), slow / len(self._outcomes)
+
+    def get_stats(self):
+        """Get the state, recent failure rates and transitions of the circuit"""
+        with self._lock:
+            failure_rate, slow_rate = self._rates()
+            return {
+                'state': self.state,
+                'calls': len(self._outcomes),
+                'failure_rate': round(failure_rate, 3),
+                'slow_rate': round(slow_rate, 3),
+                'transitions': list(self.transitions)
+            }
+
+_breakers = {}
+_breakers_lock = threading.Lock()
+_capabilities = None
+_capabilities_lock = threading.Lock()
+
+def get_breaker(provider):
+    """
+    Get the circuit breaker of a provider.
+
+    Args:
+        provider: Provider name
+
+    Returns:
+        CircuitBreaker: The provider's breaker, or None for hosts that are not providers
+    """
+    if provider not in PROVIDER_REQUIREMENTS or not current_app.config.get('CIRCUIT_BREAKER_ENABLED', True):
+        return None
+
+    breaker = _breakers.get(provider)
+    if breaker is None:
+        with _breakers_lock:
+            breaker = _breakers.get(provider)
+            if breaker is None:
+                breaker = CircuitBreaker(provider, **current_app.config.get('CIRCUIT_BREAKER', {}))
+                _breakers[provider] = breaker
+    return breaker
+
+def check_provider_capabilities():
+    """
+    Check which providers have the configuration they need, logging missing keys once.
+
+    Returns:
+        dict: Whether each provider is configured
+    """
+    global _capabilities
+    with _capabilities_lock:
+        if _capabilities is None:
+            capabilities = {}
+            for provider, keys in PROVIDER_REQUIREMENTS.items():
+                missing = [key for key in keys if not current_app.config.get(key)]
+                capabilities[provider] = not missing
+                if missing:
+                    logger.warning(f"{provider} disabled: {', '.join(missing)} not configured")
+            _capabilities = capabilities
+        return _capabilities
+
+def provider_available(provider):
+    """
+    Check whether a provider is configured and its circuit lets requests through.
+
+    Args:
+        provider: Provider name
+
+    Returns:
+        bool: False if calling the provider now is known to be pointless
+    """
+    if not check_provider_capabilities().get(provider, True):
+        return False
+
+    breaker = get_breaker(provider)
+    return breaker is None or breaker.available()
+
+def get_provider_health():
+    """
+    Get the configuration and circuit state of every provider in this process.
+
+    Returns:
+        dict: Health per provider
+    """
+    capabilities = check_provider_capabilities()
+    health = {}
+    for provider in PROVIDER_REQUIREMENTS:
+        breaker = get_breaker(provider)
+        health[provider] = dict(
+            breaker.get_stats() if breaker else {'state': CircuitBreaker.CLOSED},
+            configured=capabilities[provider]
+        )
+    return health
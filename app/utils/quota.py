@@ -0,0 +1,152 @@
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+from flask import current_app
+from app import db
+from app.models.provider_quota import ProviderQuota
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+class QuotaExhausted(Exception):
+    """Raised when a provider's request budget is used up"""
+
+# Process-local memo of providers known to be out of budget, so repeated
+# callers get an answer without a database round trip
+_denied_until = {}
+_denied_lock = threading.Lock()
+
+def _seconds_until_tomorrow(now):
+    today = datetime.utcfromtimestamp(now)
+    tomorrow = datetime(today.year, today.month, today.day) + timedelta(days=1)
+    return (tomorrow - today).total_seconds()
+
+def _deny(provider, seconds):
+    with _denied_lock:
+        _denied_until[provider] = time.time() + seconds
+    return False
+
+def acquire(provider, cost=1):
+    """
+    Take requests from a provider's budget.
+
+    Each provider has a token bucket refilled at its per-minute limit and a
+    counter of requests made on the current UTC day, shared by every process
+    through the provider_quotas table. If the budget cannot be checked the
+    request is allowed.
+
+    Args:
+        provider: Provider name, as used in PROVIDER_QUOTAS
+        cost: Number of requests to take
+
+    Returns:
+        bool: True if the request may be made, False if the provider should be skipped
+    """
+    config = current_app.config
+    limits = config.get('PROVIDER_QUOTAS', {}).get(provider)
+    if not config.get('QUOTA_ENABLED', True) or not limits:
+        return True
+
+    now = time.time()
+    with _denied_lock:
+        if _denied_until.get(provider, 0) > now:
+            return False
+
+    per_minute = limits.get('per_minute', 0)
+    per_day = limits.get('per_day', 0)
+    today = datetime.utcfromtimestamp(now).date()
+    table = ProviderQuota.__table__
+
+    try:
+        with db.engine.begin() as connection:
+            # Create the bucket full on first use; other processes may race us to it
+            connection.execute(table.insert().prefix_with('IGNORE'), {
+                'provider': provider,
+                'tokens': per_minute,
+                'refilled_at': now,
+                'day': today,
+                'day_count': 0,
+                'blocked_until': 0
+            })
+
+            # Lock the row so concurrent workers see each other's spending
+            quota = connection.execute(
+                table.select().where(table.c.provider == provider).with_for_update()
+            ).first()
+
+            if quota.blocked_until > now:
+                return _deny(provider, quota.blocked_until - now)
+
+            day_count = quota.day_count if quota.day == today else 0
+            if per_day and day_count + cost > per_day:
+                logger.warning(f"Daily quota of {per_day} requests for {provider} used up")
+                return _deny(provider, _seconds_until_tomorrow(now))
+
+            tokens = quota.tokens
+            if per_minute:
+                tokens = min(per_minute, tokens + (now - quota.refilled_at) * per_minute / 60)
+                if tokens < cost:
+                    return _deny(provider, (cost - tokens) * 60 / per_minute)
+
+            connection.execute(
+                table.update().where(table.c.provider == provider).values(
+                    tokens=tokens - cost if per_minute else tokens,
+                    refilled_at=now,
+                    day=today,
+                    day_count=day_count + cost
+                )
+            )
+    except Exception as e:
+        # Never let the quota store take the providers down with it
+        logger.warning(f"Error checking quota for {provider}, allowing request: {str(e)}")
+        return True
+
+    return True
+
+def report_exhausted(provider, retry_after=None):
+    """
+    Record that a provider rejected a request for exceeding its rate limit.
+
+    Args:
+        provider: Provider name
+        retry_after: Retry-After header value in seconds, if the provider sent one
+    """
+    try:
+        seconds = float(retry_after)
+    except (TypeError, ValueError):
+        seconds = current_app.config.get('QUOTA_DEFAULT_BACKOFF', 60)
+
+    _deny(provider, seconds)
+
+    table = ProviderQuota.__table__
+    try:
+        with db.engine.begin() as connection:
+            connection.execute(
+                table.update().where(table.c.provider == provider).values(blocked_until=time.time() + seconds)
+            )
+    except Exception as e:
+        logger.warning(f"Error recording rate limit for {provider}: {str(e)}")
+
+def get_quota_stats():
+    """
+    Get the current budget of every provider with a quota.
+
+    Returns:
+        dict: Requests made today and tokens left per provider
+    """
+    try:
+        return {
+            quota.provider: {
+                'tokens': round(quota.tokens, 1),
+                'day': quota.day.isoformat(),
+                'day_count': quota.day_count,
+                'blocked': quota.blocked_until > time.time()
+            }
+            for quota in ProviderQuota.query.all()
+        }
+    except Exception as e:
+        db.session.rollback()
+        logger.warning(f"Error reading quota stats: {str(e)}")
+        return {}
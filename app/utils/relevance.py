@@ -0,0 +1,216 @@
+import re
+from functools import lru_cache
+
+# Map topics to relevant sources
+TOPIC_SOURCE_MAPPING = {
+    'finance': ['bloomberg', 'wsj', 'ft', 'cnbc', 'marketwatch', 'investopedia', 'forbes'],
+    'investing': ['bloomberg', 'wsj', 'ft', 'cnbc', 'marketwatch', 'investopedia', 'forbes'],
+    'crypto': ['coindesk', 'cointelegraph', 'decrypt', 'theblock'],
+    'technology': ['techcrunch', 'wired', 'theverge', 'arstechnica', 'engadget'],
+    'ai': ['techcrunch', 'wired', 'theverge', 'technologyreview', 'venturebeat'],
+    'health': ['webmd', 'nih', 'who', 'mayoclinic', 'healthline'],
+    'science': ['scientificamerican', 'nature', 'science', 'newscientist'],
+    'politics': ['politico', 'thehill', 'washingtonpost', 'nytimes']
+}
+
+# Keywords that suggest an article is unrelated to a topic
+UNRELATED_INDICATORS = {
+    'finance': ['recipe', 'cooking', 'movie', 'film', 'celebrity', 'sport'],
+    'crypto': ['recipe', 'cooking', 'gardening', 'sports'],
+    'technology': ['recipe', 'cooking', 'gardening'],
+    'ai': ['recipe', 'cooking', 'gardening', 'sports'],
+    'stock market': ['recipe', 'cooking', 'gardening', 'celebrity'],
+    'ipo': ['recipe', 'gardening', 'celebrity', 'sports'],
+    'health': ['stock market', 'cryptocurrency', 'gardening'],
+    'science': ['celebrity', 'gossip', 'reality tv']
+}
+
+# Map topics to related terms
+TOPIC_TERM_MAPPING = {
+    'finance': ['money', 'financial', 'economy', 'economic', 'bank', 'investment', 'market', 'stock', 'fund'],
+    'investing': ['investment', 'stock', 'market', 'fund', 'portfolio', 'asset', 'equity', 'share', 'bond'],
+    'crypto': ['bitcoin', 'ethereum', 'blockchain', 'token', 'coin', 'mining', 'wallet', 'exchange', 'defi'],
+    'ipo': ['offering', 'public', 'listing', 'share', 'stock', 'market', 'debut', 'investor'],
+    'ai': ['artificial intelligence', 'machine learning', 'neural', 'algorithm', 'model', 'data', 'training'],
+    'technology': ['tech', 'digital', 'software', 'hardware', 'app', 'internet', 'device', 'computer'],
+}
+
+# Separates title from content when both are scanned in one pass
+_SEPARATOR = '\x00'
+
+def _expand_keywords(keywords):
+    """Add singular/plural and -ing/-ed variations of each keyword"""
+    expanded_keywords = set(keywords)
+    for keyword in keywords:
+        # Add singular/plural variations
+        if keyword.endswith('s'):
+            expanded_keywords.add(keyword[:-1])  # Remove 's'
+        else:
+            expanded_keywords.add(f"{keyword}s")  # Add 's'
+
+        # Add common prefixes/suffixes
+        expanded_keywords.add(f"{keyword}ing")
+        expanded_keywords.add(f"{keyword}ed")
+    return expanded_keywords
+
+def _terms_for_topic(mapping, topic):
+    """Collect the terms of every mapping key contained in the topic"""
+    terms = set()
+    for key, values in mapping.items():
+        if key in topic:
+            terms.update(values)
+    return terms
+
+class RelevanceMatcher:
+    """
+    Relevance scorer for one area of interest.
+
+    Every keyword, irrelevance indicator and related term for the topic is
+    compiled into a single regular expression, so each article is scanned
+    once instead of running a substring test per keyword. Scores are the
+    same as the per-keyword substring checks they replace.
+    """
+
+    def __init__(self, area_of_interest):
+        self.area = area_of_interest.lower()
+        self.interest_keywords = frozenset(keyword.lower() for keyword in area_of_interest.split())
+        self.area_words = frozenset(self.area.split())
+        self.expanded_keywords = frozenset(_expand_keywords([keyword.lower() for keyword in area_of_interest.split()]))
+        self.irrelevant_terms = frozenset(_terms_for_topic(UNRELATED_INDICATORS, self.area))
+        self.semantic_terms = frozenset(_terms_for_topic(TOPIC_TERM_MAPPING, self.area))
+
+        relevant_sources = _terms_for_topic(TOPIC_SOURCE_MAPPING, self.area)
+        self._source_pattern = re.compile('|'.join(re.escape(s) for s in sorted(relevant_sources))) if relevant_sources else None
+        self._source_scores = {}
+
+        patterns = self.expanded_keywords | self.interest_keywords | self.area_words | self.irrelevant_terms | self.semantic_terms | {self.area}
+
+        # An empty pattern is a substring of every text
+        self._always_present = frozenset(p for p in patterns if p == '')
+        patterns = sorted((p for p in patterns if p), key=len, reverse=True)
+
+        # A zero-width lookahead finds the longest pattern starting at every
+        # position; every shorter pattern found there is one of its prefixes
+        self._prefixes = {
+            pattern: frozenset(other for other in patterns if pattern.startswith(other))
+            for pattern in patterns
+        }
+        self._pattern = re.compile('(?=(' + '|'.join(re.escape(p) for p in patterns) + '))') if patterns else None
+
+    def _scan(self, title, content):
+        """
+        Find which patterns occur in the title and in the content.
+
+        Returns:
+            tuple: (patterns found in title, patterns found in content)
+        """
+        title_hits = set(self._always_present)
+        content_hits = set(self._always_present)
+
+        if self._pattern is not None:
+            boundary = len(title)
+            for match in self._pattern.finditer(title + _SEPARATOR + content):
+                found = self._prefixes[match.group(1)]
+                if match.start() < boundary:
+                    title_hits.update(found)
+                else:
+                    content_hits.update(found)
+
+        return title_hits, content_hits
+
+    @staticmethod
+    def _normalize(article):
+        """Get the lowercased title and content+snippet text of an article"""
+        title = article.get('title', '').lower()
+        content = (article.get('content', '') + ' ' + article.get('snippet', '')).lower()
+        return title, content
+
+    def is_source_relevant(self, source):
+        """Check if a source is particularly relevant for the topic"""
+        if self._source_pattern is None:
+            return False
+
+        source = source.lower()
+        relevant = self._source_scores.get(source)
+        if relevant is None:
+            relevant = self._source_pattern.search(source) is not None
+            self._source_scores[source] = relevant
+        return relevant
+
+    def contains_irrelevant_keywords(self, text):
+        """Check if the text contains keywords that suggest it's not relevant to the topic"""
+        hits, _ = self._scan(text.lower(), '')
+        return self._is_irrelevant(hits)
+
+    def _is_irrelevant(self, title_hits):
+        # If the exact area of interest is in the text, it's relevant
+        if self.area in title_hits:
+            return False
+        return not self.irrelevant_terms.isdisjoint(title_hits)
+
+    def score(self, article):
+        """
+        Score an article's relevance to the topic.
+
+        Args:
+            article: Article dictionary
+
+        Returns:
+            int: Relevance score
+        """
+        title, content = self._normalize(article)
+        title_hits, content_hits = self._scan(title, content)
+
+        # Keywords in the title carry the highest weight
+        score = 5 * len(self.expanded_keywords & title_hits)
+
+        # Exact area of interest in the title
+        if self.area in title_hits:
+            score += 10
+
+        # Keywords in content/snippet carry medium weight
+        score += 3 * len(self.expanded_keywords & content_hits)
+
+        # Certain sources are better for certain topics
+        if self.is_source_relevant(article.get('source', '')):
+            score += 2
+
+        # Penalize articles with irrelevant keywords in title
+        if self._is_irrelevant(title_hits):
+            score -= 5
+
+        return score
+
+    def is_relevant(self, article):
+        """
+        Final relevance check for an article.
+
+        Args:
+            article: Article dictionary
+
+        Returns:
+            bool: True if the area of interest, one of its words, or a related term is present
+        """
+        title, content = self._normalize(article)
+        title_hits, content_hits = self._scan(title, content)
+
+        return (
+            self.area in title_hits or
+            self.area in content_hits or
+            not self.area_words.isdisjoint(title_hits) or
+            not self.semantic_terms.isdisjoint(title_hits) or
+            not self.semantic_terms.isdisjoint(content_hits)
+        )
+
+@lru_cache(maxsize=256)
+def get_relevance_matcher(area_of_interest):
+    """
+    Get the compiled relevance matcher for an area of interest.
+
+    Args:
+        area_of_interest: The topic to match
+
+    Returns:
+        RelevanceMatcher: Matcher shared by every search for the topic
+    """
+    return RelevanceMatcher(area_of_interest)
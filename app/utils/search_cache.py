@@ -0,0 +1,282 @@
+import functools
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from flask import current_app
+from app import db
+from app.models.search_cache import CachedSearchResult
+from app.utils.single_flight import SingleFlight
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+class TTLCache:
+    """Thread-safe in-process LRU cache with a per-entry time to live"""
+
+    def __init__(self, max_entries=1000):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """
+        Get a value from the cache.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The cached value, or None if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            value, expires_at = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+
+            # Mark as most recently used
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl):
+        """
+        Store a value in the cache, evicting the least recently used entries.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Time to live in seconds
+        """
+        with self._lock:
+            self._entries[key] = (value, time.time() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key):
+        """Remove a single entry from the cache"""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        """Remove every entry from the cache"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+class SearchCache:
+    """Cache for provider search results with an optional database backing store"""
+
+    # Purge expired database rows once every this many writes
+    PURGE_INTERVAL = 100
+
+    def __init__(self):
+        self._memory = None
+        self._lock = threading.Lock()
+        self._writes_since_purge = 0
+        self.hits = {}
+        self.misses = {}
+
+    def _config(self, name, default):
+        return current_app.config.get(name, default)
+
+    def _get_memory(self):
+        # The LRU bound comes from the app config, so build it lazily
+        if self._memory is None:
+            with self._lock:
+                if self._memory is None:
+                    self._memory = TTLCache(self._config('SEARCH_CACHE_MAX_ENTRIES', 1000))
+        return self._memory
+
+    def _uses_database(self):
+        return self._config('SEARCH_CACHE_BACKEND', 'memory') == 'database'
+
+    def enabled(self):
+        """Check whether search result caching is turned on"""
+        return self._config('SEARCH_CACHE_ENABLED', True)
+
+    def ttl_for(self, provider):
+        """Get the time to live in seconds for a provider's results"""
+        return self._config('SEARCH_CACHE_TTL', {}).get(provider, 900)
+
+    @staticmethod
+    def make_key(provider, args, kwargs):
+        """
+        Build the cache key for a provider call.
+
+        Args:
+            provider: Provider name
+            args: Positional arguments of the call
+            kwargs: Keyword arguments of the call
+
+        Returns:
+            str: SHA-256 hex digest identifying the call
+        """
+        payload = json.dumps([provider, list(args), kwargs], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _count(self, counters, provider):
+        with self._lock:
+            counters[provider] = counters.get(provider, 0) + 1
+
+    def get(self, provider, key):
+        """
+        Look up cached results for a provider call.
+
+        Args:
+            provider: Provider name
+            key: Cache key from make_key
+
+        Returns:
+            list: Cached articles, or None on a miss
+        """
+        memory = self._get_memory()
+        results = memory.get(key)
+
+        if results is None and self._uses_database():
+            try:
+                entry = CachedSearchResult.query.filter_by(cache_key=key).first()
+                now = datetime.utcnow()
+                if entry and entry.expires_at > now:
+                    results = entry.get_results()
+                    # Promote into the in-process cache for the rest of its lifetime
+                    memory.set(key, results, (entry.expires_at - now).total_seconds())
+            except Exception as e:
+                db.session.rollback()
+                logger.warning(f"Search cache lookup failed: {str(e)}")
+
+        if results is None:
+            self._count(self.misses, provider)
+            return None
+
+        self._count(self.hits, provider)
+        return [dict(article) for article in results]
+
+    def set(self, provider, key, results):
+        """
+        Store results for a provider call. Empty results are not cached.
+
+        Args:
+            provider: Provider name
+            key: Cache key from make_key
+            results: List of article dictionaries
+        """
+        if not results:
+            return
+
+        ttl = self.ttl_for(provider)
+        results = [dict(article) for article in results]
+        self._get_memory().set(key, results, ttl)
+
+        if not self._uses_database():
+            return
+
+        try:
+            expires_at = datetime.utcnow() + timedelta(seconds=ttl)
+            entry = CachedSearchResult.query.filter_by(cache_key=key).first()
+            if entry:
+                entry.set_results(results)
+                entry.expires_at = expires_at
+            else:
+                db.session.add(CachedSearchResult(key, provider, results, expires_at))
+            db.session.commit()
+        except Exception as e:
+            # Most likely another worker stored the same key first
+            db.session.rollback()
+            logger.warning(f"Search cache store failed: {str(e)}")
+            return
+
+        with self._lock:
+            self._writes_since_purge += 1
+            purge = self._writes_since_purge >= self.PURGE_INTERVAL
+            if purge:
+                self._writes_since_purge = 0
+
+        if purge:
+            self.purge_expired()
+
+    def purge_expired(self):
+        """Delete expired rows from the database backing store"""
+        try:
+            CachedSearchResult.query.filter(
+                CachedSearchResult.expires_at <= datetime.utcnow()
+            ).delete(synchronize_session=False)
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            logger.warning(f"Search cache purge failed: {str(e)}")
+
+    def get_stats(self):
+        """
+        Get cache counters for this process.
+
+        Returns:
+            dict: Hit/miss counters per provider
+        """
+        with self._lock:
+            providers = sorted(set(self.hits) | set(self.misses))
+            return {
+                'backend': self._config('SEARCH_CACHE_BACKEND', 'memory'),
+                'entries': len(self._memory) if self._memory is not None else 0,
+                'providers': {
+                    provider: {
+                        'hits': self.hits.get(provider, 0),
+                        'misses': self.misses.get(provider, 0)
+                    }
+                    for provider in providers
+                }
+            }
+
+# Process-wide cache instance
+search_cache = SearchCache()
+
+# Coalesces concurrent identical provider calls that missed the cache
+search_flight = SingleFlight()
+
+def cached_search(provider):
+    """
+    Decorator caching the results of an ArticleSearch provider method.
+
+    The cache key is built from the method arguments, so identical
+    (query, sources, dates, max_results) calls share one entry. Identical
+    calls made while the first one is still running wait for it instead of
+    calling the provider again.
+
+    Args:
+        provider: Provider name used for TTL lookup and statistics
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if not search_cache.enabled():
+                return method(self, *args, **kwargs)
+
+            key = search_cache.make_key(provider, args, kwargs)
+            results = search_cache.get(provider, key)
+            if results is not None:
+                logger.info(f"Using cached {provider} results")
+                return results
+
+            def load():
+                loaded = method(self, *args, **kwargs)
+                search_cache.set(provider, key, loaded)
+                return loaded
+
+            results = search_flight.do(key, load)
+
+            # Callers sharing a flight must not share the article dictionaries
+            return [dict(article) for article in results]
+        return wrapper
+    return decorator
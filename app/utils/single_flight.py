@@ -0,0 +1,69 @@
+import threading
+
+class _Call:
+    """An in-flight call whose result is shared by every caller of the same key"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+class SingleFlight:
+    """
+    Coalesce concurrent identical calls within the process.
+
+    The first caller for a key runs the function; callers arriving while it
+    is running wait for it and get the same result (or exception) instead
+    of making the call again.
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+        self.coalesced = 0
+
+    def do(self, key, fn):
+        """
+        Run fn once for all concurrent callers of key.
+
+        Args:
+            key: Identifies identical calls
+            fn: Function without arguments making the call
+
+        Returns:
+            The result of fn
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = _Call()
+                self._calls[key] = call
+                leader = True
+            else:
+                self.coalesced += 1
+                leader = False
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def get_stats(self):
+        """Get the number of calls in flight and the number of calls saved"""
+        with self._lock:
+            return {
+                'in_flight': len(self._calls),
+                'coalesced': self.coalesced
+            }
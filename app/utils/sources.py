@@ -0,0 +1,36 @@
+def normalize_source(source):
+    """
+    Turn a source as entered by a user into the domain searched for.
+    
+    Names without a domain extension get '.com' appended ("Tech Crunch" becomes
+    "techcrunch.com"); domains are only lowercased.
+    
+    Args:
+        source: Source name or domain
+    
+    Returns:
+        str: The domain
+    """
+    if '.' not in source:
+        domain = source.lower().replace(' ', '')
+        if not domain.endswith('.com'):
+            domain += '.com'
+        return domain
+    return source.lower()
+
+def normalize_sources(sources):
+    """
+    Normalize a list of sources, dropping duplicate domains.
+    
+    Args:
+        sources: Source names or domains
+    
+    Returns:
+        list: Domains in the order first given
+    """
+    domains = []
+    for source in sources:
+        domain = normalize_source(source)
+        if domain not in domains:
+            domains.append(domain)
+    return domains
@@ -0,0 +1,179 @@
+import hashlib
+import logging
+import threading
+from datetime import datetime, timedelta
+from flask import current_app
+from app import db
+from app.models.summary_cache import CachedSummary
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+class SummaryCache:
+    """Persistent, content-addressed cache in front of the summarization API"""
+
+    # Run eviction once every this many writes
+    EVICTION_INTERVAL = 50
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._writes_since_eviction = 0
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self.api_calls = 0
+        self.api_seconds = 0.0
+
+    @staticmethod
+    def make_key(content, model, system_prompt, max_tokens):
+        """
+        Build the cache key for a summarization request.
+
+        Args:
+            content: Content sent for summarization (after truncation)
+            model: Model name
+            system_prompt: System prompt sent with the content
+            max_tokens: Maximum number of output tokens
+
+        Returns:
+            str: SHA-256 hex digest identifying the request
+        """
+        digest = hashlib.sha256()
+        for part in (model, system_prompt, str(max_tokens), content):
+            digest.update(part.encode('utf-8'))
+            digest.update(b'\x00')
+        return digest.hexdigest()
+
+    def _enabled(self):
+        return current_app.config.get('SUMMARY_CACHE_ENABLED', True)
+
+    def _ttl(self):
+        return timedelta(seconds=current_app.config.get('SUMMARY_CACHE_TTL', 7 * 24 * 3600))
+
+    def get(self, key):
+        """
+        Look up a cached summary.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            str: The cached summary, or None on a miss
+        """
+        if not self._enabled():
+            return None
+
+        try:
+            entry = CachedSummary.query.filter_by(cache_key=key).first()
+        except Exception as e:
+            db.session.rollback()
+            logger.warning(f"Summary cache lookup failed: {str(e)}")
+            return None
+
+        if entry and entry.created_at >= datetime.utcnow() - self._ttl():
+            with self._lock:
+                self.hits += 1
+            return entry.summary
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def set(self, key, summary, model):
+        """
+        Store a summary in the cache. Error summaries are never stored.
+
+        Args:
+            key: Cache key from make_key
+            summary: Summary text returned by the API
+            model: Model that produced the summary
+        """
+        if not self._enabled() or not summary or '• Error:' in summary:
+            return
+
+        try:
+            entry = CachedSummary.query.filter_by(cache_key=key).first()
+            if entry:
+                # Refresh an expired entry in place
+                entry.summary = summary
+                entry.model = model
+                entry.created_at = datetime.utcnow()
+            else:
+                db.session.add(CachedSummary(cache_key=key, model=model, summary=summary))
+            db.session.commit()
+        except Exception as e:
+            # Most likely another worker stored the same key first
+            db.session.rollback()
+            logger.warning(f"Summary cache store failed: {str(e)}")
+            return
+
+        with self._lock:
+            self.stores += 1
+            self._writes_since_eviction += 1
+            run_eviction = self._writes_since_eviction >= self.EVICTION_INTERVAL
+            if run_eviction:
+                self._writes_since_eviction = 0
+
+        if run_eviction:
+            self.evict()
+
+    def evict(self):
+        """Remove expired entries and the oldest entries above the size limit"""
+        max_entries = current_app.config.get('SUMMARY_CACHE_MAX_ENTRIES', 10000)
+
+        try:
+            # Drop everything older than the TTL
+            cutoff = datetime.utcnow() - self._ttl()
+            removed = CachedSummary.query.filter(CachedSummary.created_at < cutoff).delete(synchronize_session=False)
+
+            # Then trim the oldest entries until we are within the size limit
+            excess = CachedSummary.query.count() - max_entries
+            if excess > 0:
+                oldest_ids = [
+                    row.id for row in
+                    CachedSummary.query.with_entities(CachedSummary.id)
+                    .order_by(CachedSummary.created_at.asc())
+                    .limit(excess)
+                ]
+                removed += CachedSummary.query.filter(CachedSummary.id.in_(oldest_ids)).delete(synchronize_session=False)
+
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            logger.warning(f"Summary cache eviction failed: {str(e)}")
+            return
+
+        with self._lock:
+            self.evictions += removed
+
+    def record_api_call(self, seconds):
+        """Record the latency of an uncached API call"""
+        with self._lock:
+            self.api_calls += 1
+            self.api_seconds += seconds
+
+    def get_stats(self):
+        """
+        Get cache counters for this process.
+
+        Returns:
+            dict: Hit/miss counters and the estimated API time saved
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            avg_api_seconds = self.api_seconds / self.api_calls if self.api_calls else 0.0
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+                'stores': self.stores,
+                'evictions': self.evictions,
+                'api_calls': self.api_calls,
+                'avg_api_seconds': round(avg_api_seconds, 3),
+                'estimated_seconds_saved': round(self.hits * avg_api_seconds, 1)
+            }
+
+# Process-wide cache instance
+summary_cache = SummaryCache()
@@ -0,0 +1,93 @@
+from flask import current_app
+from flask_login import UserMixin
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+from app.models.user import User
+from app.models.preference import Preference
+from app.utils.search_cache import TTLCache
+
+class CachedUser(UserMixin):
+    """
+    Read-only copy of a user row, used as current_user.
+
+    Holds no password hash and is not attached to a database session; views
+    that need to change the user load the User model themselves.
+    """
+
+    def __init__(self, id, username, email, created_at=None, last_login=None, current_preference_id=None):
+        self.id = id
+        self.username = username
+        self.email = email
+        self.created_at = created_at
+        self.last_login = last_login
+        self.current_preference_id = current_preference_id
+
+    @classmethod
+    def from_user(cls, user):
+        """Copy the identity fields of a User"""
+        return cls(user.id, user.username, user.email, user.created_at, user.last_login, user.current_preference_id)
+
+    def __repr__(self):
+        """Representation of the cached user"""
+        return f'<CachedUser {self.username}>'
+
+# Users by id, per process
+_users = TTLCache(max_entries=10000)
+
+def load_cached_user(user_id):
+    """
+    Get the identity of a logged-in user, reading the database only on a cache miss.
+
+    Args:
+        user_id: ID of the user
+
+    Returns:
+        CachedUser: The user, or None if no such user exists
+    """
+    if not current_app.config.get('USER_CACHE_ENABLED', True):
+        return User.query.get(user_id)
+
+    cached = _users.get(user_id)
+    if cached is not None:
+        return cached
+
+    user = User.query.get(user_id)
+    if user is None:
+        return None
+
+    cached = CachedUser.from_user(user)
+    _users.set(user_id, cached, current_app.config.get('USER_CACHE_TTL', 300))
+    return cached
+
+def invalidate_user(user_id):
+    """
+    Drop a user from the cache so the next request reads it again.
+
+    Args:
+        user_id: ID of the user
+    """
+    _users.invalidate(user_id)
+
+def _invalidate_on_commit(target, user_id):
+    """Invalidate now and again once the change is committed, so no request caches the old row in between"""
+    invalidate_user(user_id)
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault('invalidated_users', set()).add(user_id)
+
+@event.listens_for(User, 'after_update')
+@event.listens_for(User, 'after_delete')
+def _invalidate_changed_user(mapper, connection, target):
+    """Keep the cache in step with changes made through the User model in this process"""
+    _invalidate_on_commit(target, target.id)
+
+@event.listens_for(Preference, 'after_insert')
+@event.listens_for(Preference, 'after_update')
+def _invalidate_preference_owner(mapper, connection, target):
+    """A preference write moves its user's current_preference_id"""
+    _invalidate_on_commit(target, target.user_id)
+
+@event.listens_for(Session, 'after_commit')
+def _invalidate_committed_users(session):
+    for user_id in session.info.pop('invalidated_users', ()):
+        invalidate_user(user_id)
@@ -0,0 +1,79 @@
+"""
+Compare the 'full' and 'fast' Google News result page parsers.
+
+Usage:
+    python benchmarks/bench_google_news_parse.py [saved_page.html ...]
+
+Save result pages with e.g.
+    curl -A "Mozilla/5.0" "https://news.google.com/search?q=bitcoin&hl=en" > bitcoin.html
+
+Without arguments a synthetic page of the same shape is used.
+"""
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils.article_search import parse_google_news_html
+from app.utils.article_fetcher import HTML_PARSER
+
+ROUNDS = 20
+
+def synthetic_page(articles=40, filler=400):
+    """Build a page shaped like a Google News results page"""
+    chrome = ''.join(
+        f'<div class="nav"><a href="./topics/{i}">Topic {i}</a><span>{"x" * 40}</span></div>'
+        for i in range(filler)
+    )
+    items = ''.join(
+        f'<article><h3><a href="./articles/{i}">Headline number {i} about markets</a></h3>'
+        f'<div>Snippet text for article {i} describing what happened.</div>'
+        f'<div data-n-tid="9"><a>Source {i}</a><time datetime="2024-05-0{i % 9 + 1}T10:00:00Z"></time></div>'
+        f'</article>'
+        for i in range(articles)
+    )
+    return f'<html><head><script>{"var a=1;" * 2000}</script></head><body>{chrome}{items}{chrome}</body></html>'
+
+def measure(html, mode):
+    """Get the mean parse time and the peak traced memory of one parse"""
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        parse_google_news_html(html, max_elements=10, max_articles=10, mode=mode)
+    elapsed = (time.perf_counter() - started) / ROUNDS
+
+    tracemalloc.start()
+    parse_google_news_html(html, max_elements=10, max_articles=10, mode=mode)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return elapsed, peak
+
+def main(paths):
+    pages = []
+    for path in paths:
+        with open(path, encoding='utf-8', errors='replace') as page:
+            pages.append((os.path.basename(path), page.read()))
+    if not pages:
+        pages.append(('synthetic', synthetic_page()))
+
+    print(f"fast mode parser: {HTML_PARSER}")
+    print(f"{'page':<30} {'size':>9} {'full ms':>9} {'fast ms':>9} {'full peak':>11} {'fast peak':>11}")
+
+    for name, html in pages:
+        full_time, full_peak = measure(html, 'full')
+        fast_time, fast_peak = measure(html, 'fast')
+
+        # Both modes must find the same articles
+        if parse_google_news_html(html, mode='full') != parse_google_news_html(html, mode='fast'):
+            print(f"warning: {name}: fast and full parsers returned different articles")
+
+        print(
+            f"{name[:30]:<30} {len(html) // 1024:>7}KB "
+            f"{full_time * 1000:>9.1f} {fast_time * 1000:>9.1f} "
+            f"{full_peak / 1024:>9.0f}KB {fast_peak / 1024:>9.0f}KB"
+        )
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
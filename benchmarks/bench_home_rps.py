@@ -0,0 +1,64 @@
+"""
+Measure requests per second on /home with and without the user cache.
+
+Usage:
+    python benchmarks/bench_home_rps.py --user-id 1 [--requests 500] [--threads 4]
+
+Needs the configured MySQL database with the given user, a preference and
+an up-to-date digest for it (run `python worker.py --once` first), so /home
+renders from the stored digest instead of calling the providers.
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import app
+
+def run(user_id, requests, threads):
+    """Send requests to /home from several logged-in clients and return requests per second"""
+    per_thread = requests // threads
+    errors = []
+
+    def worker():
+        client = app.test_client()
+        with client.session_transaction() as session:
+            session['_user_id'] = str(user_id)
+            session['_fresh'] = True
+        for _ in range(per_thread):
+            response = client.get('/home')
+            if response.status_code != 200:
+                errors.append(response.status_code)
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    started = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    if errors:
+        print(f"warning: {len(errors)} requests failed (first status {errors[0]}); is there a current digest?")
+    return per_thread * threads / elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark /home requests per second')
+    parser.add_argument('--user-id', type=int, required=True, help='User with a preference and a current digest')
+    parser.add_argument('--requests', type=int, default=500)
+    parser.add_argument('--threads', type=int, default=4)
+    args = parser.parse_args()
+
+    app.config['HOME_STREAMING'] = False
+
+    for enabled in (False, True):
+        app.config['USER_CACHE_ENABLED'] = enabled
+        run(args.user_id, args.threads * 10, args.threads)  # Warm up pools and caches
+        rps = run(args.user_id, args.requests, args.threads)
+        print(f"user cache {'on ' if enabled else 'off'}: {rps:8.1f} requests/s")
+
+if __name__ == '__main__':
+    main()
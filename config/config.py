@@ -19,13 +19,128 @@ class Config:
         os.environ.get('DB_NAME', 'article_summarizer')
     )
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'pool_size': int(os.environ.get('DB_POOL_SIZE', 10)),  # Connections kept open per process
+        'max_overflow': int(os.environ.get('DB_MAX_OVERFLOW', 20)),  # Extra connections allowed under load
+        'pool_timeout': int(os.environ.get('DB_POOL_TIMEOUT', 10)),  # Seconds to wait for a free connection
+        'pool_pre_ping': os.environ.get('DB_POOL_PRE_PING', 'True').lower() in ('true', '1', 't'),  # Replace connections the server dropped
+        'pool_recycle': int(os.environ.get('DB_POOL_RECYCLE', 280))  # Seconds; below MySQL's wait_timeout
+    }
     
     # Perplexity API configuration
     PERPLEXITY_API_KEY = os.environ.get('PERPLEXITY_API_KEY', '')
+    SUMMARY_MAX_WORKERS = int(os.environ.get('SUMMARY_MAX_WORKERS', 5))  # Summaries in flight at once (1 = sequential)
+    SUMMARY_INPUT_TOKEN_BUDGET = int(os.environ.get('SUMMARY_INPUT_TOKEN_BUDGET', 800))  # Article tokens sent per summary after extractive reduction
+    SUMMARY_MIN_OUTPUT_TOKENS = int(os.environ.get('SUMMARY_MIN_OUTPUT_TOKENS', 200))  # Output token limit scales between these with input size
+    SUMMARY_MAX_OUTPUT_TOKENS = int(os.environ.get('SUMMARY_MAX_OUTPUT_TOKENS', 800))
+    SUMMARY_BATCH_MODE = os.environ.get('SUMMARY_BATCH_MODE', 'False').lower() in ('true', '1', 't')  # Pack several articles per request
+    SUMMARY_BATCH_TOKEN_BUDGET = int(os.environ.get('SUMMARY_BATCH_TOKEN_BUDGET', 4000))  # Prompt plus output tokens per batch
+    SUMMARY_BATCH_MAX_ARTICLES = int(os.environ.get('SUMMARY_BATCH_MAX_ARTICLES', 5))
+    SUMMARY_BATCH_OUTPUT_TOKENS = int(os.environ.get('SUMMARY_BATCH_OUTPUT_TOKENS', 200))  # Output tokens reserved per article
+    
+    # Summary cache configuration
+    SUMMARY_CACHE_ENABLED = os.environ.get('SUMMARY_CACHE_ENABLED', 'True').lower() in ('true', '1', 't')
+    SUMMARY_CACHE_TTL = int(os.environ.get('SUMMARY_CACHE_TTL', 7 * 24 * 3600))  # Seconds
+    SUMMARY_CACHE_MAX_ENTRIES = int(os.environ.get('SUMMARY_CACHE_MAX_ENTRIES', 10000))
     
     # News API configuration
     NEWS_API_KEY = os.environ.get('NEWS_API_KEY', '')
     
     # Google Custom Search API configuration
     GOOGLE_API_KEY = os.environ.get('GOOGLE_API_KEY', '')
-    GOOGLE_SEARCH_ENGINE_ID = os.environ.get('GOOGLE_SEARCH_ENGINE_ID', '')
\ No newline at end of file
+    GOOGLE_SEARCH_ENGINE_ID = os.environ.get('GOOGLE_SEARCH_ENGINE_ID', '')
+    
+    # Article search configuration
+    SEARCH_MAX_WORKERS = int(os.environ.get('SEARCH_MAX_WORKERS', 8))  # Sources searched concurrently
+    ARTICLE_STORE_ENABLED = os.environ.get('ARTICLE_STORE_ENABLED', 'True').lower() in ('true', '1', 't')  # Keep fetched articles in the database
+    FETCHED_WINDOW_TTL = int(os.environ.get('FETCHED_WINDOW_TTL', 7 * 24 * 3600))  # Seconds before a fetched day is searched again
+    GOOGLE_NEWS_PARSER = os.environ.get('GOOGLE_NEWS_PARSER', 'fast')  # 'fast' (only <article> elements, lxml if installed) or 'full'
+    GOOGLE_BATCH_ENABLED = os.environ.get('GOOGLE_BATCH_ENABLED', 'True').lower() in ('true', '1', 't')  # Combine sources into 'site:a OR site:b' queries
+    GOOGLE_SITES_PER_QUERY = int(os.environ.get('GOOGLE_SITES_PER_QUERY', 5))
+    GOOGLE_MAX_PAGES = int(os.environ.get('GOOGLE_MAX_PAGES', 2))  # Pages of 10 results per query group
+    NEWS_API_BATCH_ENABLED = os.environ.get('NEWS_API_BATCH_ENABLED', 'True').lower() in ('true', '1', 't')  # One News API search for all sources
+    NEWS_API_MAX_PAGES = int(os.environ.get('NEWS_API_MAX_PAGES', 2))  # Pages of 100 results per batched search
+    NEAR_DUPLICATE_THRESHOLD = float(os.environ.get('NEAR_DUPLICATE_THRESHOLD', 0.9))  # SimHash similarity for collapsing near-duplicate articles (0 disables)
+    
+    # Search result cache configuration
+    SEARCH_CACHE_ENABLED = os.environ.get('SEARCH_CACHE_ENABLED', 'True').lower() in ('true', '1', 't')
+    SEARCH_CACHE_BACKEND = os.environ.get('SEARCH_CACHE_BACKEND', 'memory')  # 'memory' or 'database'
+    SEARCH_CACHE_MAX_ENTRIES = int(os.environ.get('SEARCH_CACHE_MAX_ENTRIES', 1000))  # In-process LRU bound
+    SEARCH_CACHE_TTL = {  # Seconds per provider
+        'google': int(os.environ.get('SEARCH_CACHE_TTL_GOOGLE', 3600)),
+        'newsapi': int(os.environ.get('SEARCH_CACHE_TTL_NEWSAPI', 1800)),
+        'google_news': int(os.environ.get('SEARCH_CACHE_TTL_GOOGLE_NEWS', 900))
+    }
+    
+    # Outbound HTTP configuration
+    HTTP_POOL_CONNECTIONS = int(os.environ.get('HTTP_POOL_CONNECTIONS', 10))  # Hosts kept in the default pool
+    HTTP_POOL_MAXSIZE = int(os.environ.get('HTTP_POOL_MAXSIZE', 20))  # Keep-alive connections per host
+    HTTP_TIMEOUTS = {  # (connect, read) seconds per provider
+        'google': (3.05, float(os.environ.get('GOOGLE_READ_TIMEOUT', 10))),
+        'newsapi': (3.05, float(os.environ.get('NEWS_API_READ_TIMEOUT', 10))),
+        'google_news': (3.05, float(os.environ.get('GOOGLE_NEWS_READ_TIMEOUT', 10))),
+        'perplexity': (3.05, float(os.environ.get('PERPLEXITY_READ_TIMEOUT', 45))),
+        'default': (3.05, 10)
+    }
+    HTTP_RETRIES = {  # Transport-level retries per provider
+        'google': 2,
+        'newsapi': 2,
+        'google_news': 1,
+        'perplexity': 1,  # Connection failures only; API errors are retried in PerplexityAPI
+        'default': 1
+    }
+    HTTP_PREWARM = os.environ.get('HTTP_PREWARM', 'False').lower() in ('true', '1', 't')  # Open provider connections at startup
+    
+    # Article page fetching
+    ARTICLE_FETCH_ENABLED = os.environ.get('ARTICLE_FETCH_ENABLED', 'True').lower() in ('true', '1', 't')  # Summarize full text instead of snippets
+    ARTICLE_FETCH_DEADLINE = float(os.environ.get('ARTICLE_FETCH_DEADLINE', 8))  # Seconds for all pages of a digest
+    ARTICLE_FETCH_MAX_BYTES = int(os.environ.get('ARTICLE_FETCH_MAX_BYTES', 1024 * 1024))  # Bytes read per page
+    ARTICLE_FETCH_PER_HOST = int(os.environ.get('ARTICLE_FETCH_PER_HOST', 2))  # Concurrent downloads per publisher
+    ARTICLE_FETCH_MAX_WORKERS = int(os.environ.get('ARTICLE_FETCH_MAX_WORKERS', 8))
+    ARTICLE_FETCH_CACHE_TTL = int(os.environ.get('ARTICLE_FETCH_CACHE_TTL', 6 * 3600))  # Seconds
+    
+    # Provider request budgets, shared by every worker process (0 = no limit)
+    QUOTA_ENABLED = os.environ.get('QUOTA_ENABLED', 'True').lower() in ('true', '1', 't')
+    QUOTA_DEFAULT_BACKOFF = int(os.environ.get('QUOTA_DEFAULT_BACKOFF', 60))  # Seconds to skip a provider after a 429 without Retry-After
+    PROVIDER_QUOTAS = {
+        'google': {
+            'per_minute': int(os.environ.get('GOOGLE_QUOTA_PER_MINUTE', 100)),
+            'per_day': int(os.environ.get('GOOGLE_QUOTA_PER_DAY', 100))  # Custom Search free tier
+        },
+        'newsapi': {
+            'per_minute': int(os.environ.get('NEWS_API_QUOTA_PER_MINUTE', 30)),
+            'per_day': int(os.environ.get('NEWS_API_QUOTA_PER_DAY', 100))  # Developer plan
+        },
+        'google_news': {
+            'per_minute': int(os.environ.get('GOOGLE_NEWS_QUOTA_PER_MINUTE', 20)),
+            'per_day': 0
+        },
+        'perplexity': {
+            'per_minute': int(os.environ.get('PERPLEXITY_QUOTA_PER_MINUTE', 50)),
+            'per_day': int(os.environ.get('PERPLEXITY_QUOTA_PER_DAY', 0))
+        }
+    }
+    
+    # Provider circuit breakers (per worker process)
+    CIRCUIT_BREAKER_ENABLED = os.environ.get('CIRCUIT_BREAKER_ENABLED', 'True').lower() in ('true', '1', 't')
+    CIRCUIT_BREAKER = {
+        'window': int(os.environ.get('CIRCUIT_BREAKER_WINDOW', 20)),  # Recent calls considered
+        'min_calls': int(os.environ.get('CIRCUIT_BREAKER_MIN_CALLS', 5)),  # Calls needed before the circuit can open
+        'error_rate': float(os.environ.get('CIRCUIT_BREAKER_ERROR_RATE', 0.5)),
+        'slow_call_seconds': float(os.environ.get('CIRCUIT_BREAKER_SLOW_CALL_SECONDS', 8)),
+        'slow_call_rate': float(os.environ.get('CIRCUIT_BREAKER_SLOW_CALL_RATE', 0.8)),
+        'open_seconds': int(os.environ.get('CIRCUIT_BREAKER_OPEN_SECONDS', 60))  # Before a probe request is let through
+    }
+    
+    # Logged-in user cache (per worker process)
+    USER_CACHE_ENABLED = os.environ.get('USER_CACHE_ENABLED', 'True').lower() in ('true', '1', 't')
+    USER_CACHE_TTL = int(os.environ.get('USER_CACHE_TTL', 300))  # Seconds; bounds staleness of changes made by other processes
+    
+    # Buffered last-login writes (per worker process)
+    LAST_LOGIN_WRITE_BEHIND = os.environ.get('LAST_LOGIN_WRITE_BEHIND', 'True').lower() in ('true', '1', 't')
+    LAST_LOGIN_FLUSH_INTERVAL = int(os.environ.get('LAST_LOGIN_FLUSH_INTERVAL', 5))  # Seconds between bulk writes
+    
+    # Background digest configuration
+    DIGEST_POLL_INTERVAL = int(os.environ.get('DIGEST_POLL_INTERVAL', 15))  # Seconds between worker passes
+    DIGEST_REFRESH_INTERVAL = int(os.environ.get('DIGEST_REFRESH_INTERVAL', 1800))  # Maximum digest age in seconds
+    HOME_STREAMING = os.environ.get('HOME_STREAMING', 'True').lower() in ('true', '1', 't')  # Stream summaries when no digest is ready
@@ -1,13 +1,20 @@
 from app import app
 from app.utils.db_helper import init_db
+from app.utils.http_client import prewarm_connections
+from app.utils.provider_health import check_provider_capabilities
 import os
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
-# Initialize the database if needed
-init_db()
+# Initialize and migrate the database if needed, report unconfigured providers once,
+# then open provider connections ahead of the first request if configured
+with app.app_context():
+    init_db()
+    check_provider_capabilities()
+    if app.config['HTTP_PREWARM']:
+        prewarm_connections()
 
 if __name__ == "__main__":
     # Get port from environment variable or use default 5000
@@ -0,0 +1,18 @@
+from app import app
+from app.utils.digest_builder import run_worker
+from app.utils.provider_health import check_provider_capabilities
+import argparse
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+if __name__ == "__main__":
+    # Run as a separate process next to the web server: python worker.py
+    parser = argparse.ArgumentParser(description='Precompute article digests in the background')
+    parser.add_argument('--once', action='store_true', help='Run a single pass and exit')
+    args = parser.parse_args()
+    
+    with app.app_context():
+        check_provider_capabilities()
+        run_worker(run_once=args.once)